@@ -52,6 +52,20 @@ var sensitivePatterns = []*regexp.Regexp{
 	regexp.MustCompile(`(?i)secret[=:]\S+`),
 }
 
+// sensitiveDataPattern fuses sensitivePatterns into one alternation so a
+// presence check is a single scan instead of one per pattern
+var sensitiveDataPattern = combinePatterns(sensitivePatterns)
+
+// combinePatterns joins compiled patterns into a single alternation. Each
+// pattern keeps its own flags because they are scoped to its group.
+func combinePatterns(patterns []*regexp.Regexp) *regexp.Regexp {
+	parts := make([]string, len(patterns))
+	for i, pattern := range patterns {
+		parts[i] = "(?:" + pattern.String() + ")"
+	}
+	return regexp.MustCompile(strings.Join(parts, "|"))
+}
+
 // GenericErrorMessages maps internal error types to generic client messages
 var genericErrorMessages = map[int]string{
 	http.StatusBadRequest:          "Invalid request",
@@ -72,37 +86,15 @@ var genericErrorMessages = map[int]string{
 // SecureErrorResponse sends a secure error response to the client
 // It returns generic messages to clients and logs detailed errors internally
 func (h *SecureErrorHandler) SecureErrorResponse(c *gin.Context, statusCode int, internalError error, context string) {
-	requestID := c.GetString("request_id")
-	if requestID == "" {
-		requestID = "unknown"
-	}
-
 	// Get generic message for client
 	genericMessage := genericErrorMessages[statusCode]
 	if genericMessage == "" {
 		genericMessage = "An error occurred"
 	}
 
-	// Log detailed error internally
-	h.logDetailedError(c, statusCode, internalError, context, requestID)
-
-	// Build client response
-	response := models.ErrorResponse{
-		Success:   false,
-		Error:     genericMessage,
-		Code:      http.StatusText(statusCode),
-		Timestamp: time.Now(),
-	}
-
-	// Only include detail in development mode
-	if h.exposeDetailedErrors && internalError != nil {
-		response.Detail = h.sanitizeErrorMessage(internalError.Error())
-	}
-
-	c.JSON(statusCode, response)
+	h.SecureErrorResponseWithMessage(c, statusCode, genericMessage, internalError, context)
 }
 
-
 // SecureErrorResponseWithMessage sends a secure error response with a custom generic message
 func (h *SecureErrorHandler) SecureErrorResponseWithMessage(c *gin.Context, statusCode int, genericMessage string, internalError error, context string) {
 	requestID := c.GetString("request_id")
@@ -135,6 +127,20 @@ func (h *SecureErrorHandler) logDetailedError(c *gin.Context, statusCode int, er
 		return
 	}
 
+	// Log at appropriate level based on status code
+	level, message := logrus.InfoLevel, "Error response sent"
+	switch {
+	case statusCode >= 500:
+		level, message = logrus.ErrorLevel, "Server error occurred"
+	case statusCode >= 400:
+		level, message = logrus.WarnLevel, "Client error occurred"
+	}
+
+	// Skip building the field set when the entry would be filtered out anyway
+	if !h.logger.IsLevelEnabled(level) {
+		return
+	}
+
 	fields := logrus.Fields{
 		"request_id":  requestID,
 		"status_code": statusCode,
@@ -150,15 +156,7 @@ func (h *SecureErrorHandler) logDetailedError(c *gin.Context, statusCode int, er
 		fields["error_type"] = fmt.Sprintf("%T", err)
 	}
 
-	// Log at appropriate level based on status code
-	switch {
-	case statusCode >= 500:
-		h.logger.WithFields(fields).Error("Server error occurred")
-	case statusCode >= 400:
-		h.logger.WithFields(fields).Warn("Client error occurred")
-	default:
-		h.logger.WithFields(fields).Info("Error response sent")
-	}
+	h.logger.WithFields(fields).Log(level, message)
 }
 
 // sanitizeErrorMessage removes sensitive information from error messages
@@ -175,12 +173,7 @@ func (h *SecureErrorHandler) sanitizeErrorMessage(message string) string {
 
 // ContainsSensitiveData checks if a string contains sensitive data patterns
 func ContainsSensitiveData(s string) bool {
-	for _, pattern := range sensitivePatterns {
-		if pattern.MatchString(s) {
-			return true
-		}
-	}
-	return false
+	return sensitiveDataPattern.MatchString(s)
 }
 
 // StripSensitiveData removes sensitive data from a string
@@ -192,42 +185,43 @@ func StripSensitiveData(s string) string {
 	return result
 }
 
+// sensitiveIndicators are lower-case substrings that mark a message as non-generic
+var sensitiveIndicators = []string{
+	".go:",             // Go file references
+	".py:",             // Python file references
+	"goroutine",        // Stack traces
+	"panic:",           // Panic messages
+	"runtime error:",   // Runtime errors
+	"sql:",             // SQL errors
+	"connection refused", // Connection details
+	"connection failed",  // Connection details
+	"password=",        // Password references
+	"password:",        // Password references
+	"token=",           // Token references
+	"token:",           // Token references
+	"secret=",          // Secret references
+	"secret:",          // Secret references
+	"api_key=",         // API key references
+	"apikey=",          // API key references
+	"localhost:",       // Internal addresses with port
+	"127.0.0.1:",       // Loopback addresses with port
+	"internal_service", // Internal service names
+	"internal-service", // Internal service names
+	"backend_server",   // Backend references
+	"backend-server",   // Backend references
+	"/home/",           // Unix paths
+	"/var/",            // Unix paths
+	"/etc/",            // Unix paths
+	"c:\\",             // Windows paths
+	"d:\\",             // Windows paths
+}
+
 // IsGenericMessage checks if a message is generic (doesn't contain sensitive info)
 func IsGenericMessage(message string) bool {
-	// Check for common sensitive patterns
-	sensitiveIndicators := []string{
-		".go:",             // Go file references
-		".py:",             // Python file references
-		"goroutine",        // Stack traces
-		"panic:",           // Panic messages
-		"runtime error:",   // Runtime errors
-		"sql:",             // SQL errors
-		"connection refused", // Connection details
-		"connection failed",  // Connection details
-		"password=",        // Password references
-		"password:",        // Password references
-		"token=",           // Token references
-		"token:",           // Token references
-		"secret=",          // Secret references
-		"secret:",          // Secret references
-		"api_key=",         // API key references
-		"apikey=",          // API key references
-		"localhost:",       // Internal addresses with port
-		"127.0.0.1:",       // Loopback addresses with port
-		"internal_service", // Internal service names
-		"internal-service", // Internal service names
-		"backend_server",   // Backend references
-		"backend-server",   // Backend references
-		"/home/",           // Unix paths
-		"/var/",            // Unix paths
-		"/etc/",            // Unix paths
-		"C:\\",             // Windows paths
-		"D:\\",             // Windows paths
-	}
-
+	// Indicators are stored lower-case, so only the message needs folding
 	lowerMessage := strings.ToLower(message)
 	for _, indicator := range sensitiveIndicators {
-		if strings.Contains(lowerMessage, strings.ToLower(indicator)) {
+		if strings.Contains(lowerMessage, indicator) {
 			return false
 		}
 	}
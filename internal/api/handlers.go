@@ -1,6 +1,7 @@
 package api
 
 import (
+	"encoding/json"
 	"fmt"
 	"net/http"
 	"strings"
@@ -22,6 +23,7 @@ type Handler struct {
 	logger             *logrus.Logger
 	cfg                *config.Config
 	secureErrorHandler *SecureErrorHandler
+	proxyCountries     map[string]struct{}
 }
 
 // NewHandler creates a new handler
@@ -38,6 +40,14 @@ func NewHandler(
 		exposeDetailedErrors = true
 	}
 
+	// Index proxy countries once so smart routing is a single map lookup
+	proxyCountries := make(map[string]struct{})
+	if cfg != nil {
+		for _, code := range cfg.ProxyCountries {
+			proxyCountries[strings.ToUpper(code)] = struct{}{}
+		}
+	}
+
 	return &Handler{
 		video:              video,
 		streaming:          streaming,
@@ -45,6 +55,7 @@ func NewHandler(
 		logger:             logger,
 		cfg:                cfg,
 		secureErrorHandler: NewSecureErrorHandler(logger, exposeDetailedErrors),
+		proxyCountries:     proxyCountries,
 	}
 }
 
@@ -56,22 +67,40 @@ func NewHandler(
 // @Success      200  {object}  map[string]interface{}
 // @Router       / [get]
 func (h *Handler) Root(c *gin.Context) {
-	c.JSON(http.StatusOK, gin.H{
-		"name":        "Go Video Streaming API",
-		"version":     "2.0.0",
-		"description": "High-performance video streaming API built with Go",
-		"docs_url":    "/docs",
-		"health_url":  "/api/v2/system/health",
-		"endpoints": gin.H{
-			"health":    "/api/v2/system/health",
-			"streaming": "/api/v2/stream/proxy/:platform/:video_id",
-			"direct":    "/api/v2/stream/direct/:platform/:video_id",
-			"smart":     "/api/v2/stream/smart/:platform/:video_id",
-			"info":      "/api/v2/videos/:platform/:video_id",
-		},
-		"supported_platforms": []string{"youtube", "bilibili", "twitter", "instagram", "twitch"},
-		"timestamp":           time.Now(),
-	})
+	// Only the timestamp varies; splice it onto the pre-encoded static body
+	ts, _ := time.Now().MarshalJSON()
+	body := make([]byte, 0, len(rootInfoJSON)+len(`,"timestamp":`)+len(ts)+1)
+	body = append(body, rootInfoJSON[:len(rootInfoJSON)-1]...)
+	body = append(body, `,"timestamp":`...)
+	body = append(body, ts...)
+	body = append(body, '}')
+
+	c.Data(http.StatusOK, "application/json; charset=utf-8", body)
+}
+
+// rootInfoJSON is the static part of the root endpoint response, encoded once
+var rootInfoJSON = mustMarshalJSON(gin.H{
+	"name":        "Go Video Streaming API",
+	"version":     "2.0.0",
+	"description": "High-performance video streaming API built with Go",
+	"docs_url":    "/docs",
+	"health_url":  "/api/v2/system/health",
+	"endpoints": gin.H{
+		"health":    "/api/v2/system/health",
+		"streaming": "/api/v2/stream/proxy/:platform/:video_id",
+		"direct":    "/api/v2/stream/direct/:platform/:video_id",
+		"smart":     "/api/v2/stream/smart/:platform/:video_id",
+		"info":      "/api/v2/videos/:platform/:video_id",
+	},
+	"supported_platforms": []string{"youtube", "bilibili", "twitter", "instagram", "twitch"},
+})
+
+func mustMarshalJSON(v interface{}) []byte {
+	data, err := json.Marshal(v)
+	if err != nil {
+		panic(err)
+	}
+	return data
 }
 
 // GetHealth godoc
@@ -185,6 +214,7 @@ func (h *Handler) GetPlaylistInfo(c *gin.Context) {
 // @Success      302       {string}  string  "Redirect or proxied stream"
 // @Failure      400       {object}  models.ErrorResponse
 // @Router       /api/v2/stream/{platform}/{video_id} [get]
+// @Router       /api/v2/stream/{platform}/{video_id} [head]
 func (h *Handler) StreamVideo(c *gin.Context) {
 	platform := c.Param("platform")
 	videoID := strings.TrimPrefix(c.Param("video_id"), "/")
@@ -192,8 +222,9 @@ func (h *Handler) StreamVideo(c *gin.Context) {
 	// Handle URL passed in path (e.g., /api/v2/stream/https:/www.youtube.com/watch?v=...)
 	// Reconstruct full URL if platform looks like a URL scheme
 	if platform == "http:" || platform == "https:" {
-		// Reconstruct the full URL from the request
-		fullURL := platform + videoID
+		// Reconstruct the full URL from the request; the scheme's "//" may be
+		// partly or fully collapsed in the path, so restore it explicitly
+		fullURL := platform + "//" + strings.TrimLeft(videoID, "/")
 		// If query parameters exist, append them
 		if rawQuery := c.Request.URL.RawQuery; rawQuery != "" {
 			fullURL += "?" + rawQuery
@@ -230,16 +261,22 @@ func (h *Handler) StreamVideo(c *gin.Context) {
 	if useProxy {
 		modeLabel = "proxy"
 	}
-	reqFields := logrus.Fields{
-		"platform": platform,
-		"video_id": videoID,
-		"quality":  quality,
-		"mode":     modeLabel,
-		"country":  strings.ToUpper(h.detectCountry(c)),
+	// Fields are built on demand: the success path only logs at debug level
+	reqFields := func() logrus.Fields {
+		return logrus.Fields{
+			"platform": platform,
+			"video_id": videoID,
+			"quality":  quality,
+			"mode":     modeLabel,
+			"country":  h.detectCountry(c),
+		}
 	}
+	debugEnabled := h.logger.IsLevelEnabled(logrus.DebugLevel)
 
 	if useProxy {
-		h.logger.WithFields(reqFields).Info("Smart streaming via proxy")
+		if debugEnabled {
+			h.logger.WithFields(reqFields()).Debug("Smart streaming via proxy")
+		}
 		if err := h.streaming.StreamVideo(c, platform, videoID, quality, false); err != nil {
 			h.logger.WithError(err).Error("Failed to stream video")
 			if !c.Writer.Written() {
@@ -249,14 +286,16 @@ func (h *Handler) StreamVideo(c *gin.Context) {
 		return
 	}
 
-	streamURL, err := h.streaming.GetDirectStreamURL(c.Request.Context(), platform, videoID, quality)
+	streamURL, err := h.streaming.GetDirectStreamURL(c.Request.Context(), c.Request.Method, platform, videoID, quality)
 	if err != nil {
-		h.logger.WithError(err).WithFields(reqFields).Error("Failed to get stream URL")
+		h.logger.WithError(err).WithFields(reqFields()).Error("Failed to get stream URL")
 		h.errorResponse(c, http.StatusBadRequest, "Failed to get stream URL", err.Error())
 		return
 	}
 
-	h.logger.WithFields(reqFields).Info("Smart streaming via direct redirect")
+	if debugEnabled {
+		h.logger.WithFields(reqFields()).Debug("Smart streaming via direct redirect")
+	}
 	c.Redirect(http.StatusFound, streamURL)
 }
 
@@ -299,24 +338,22 @@ func (h *Handler) shouldProxyRequest(c *gin.Context) bool {
 	if h.cfg == nil {
 		return false
 	}
-	country := strings.ToUpper(h.detectCountry(c))
+	country := h.detectCountry(c)
 	if country == "" {
 		return strings.EqualFold(h.cfg.DefaultStreamMode, "proxy")
 	}
-	for _, code := range h.cfg.ProxyCountries {
-		if strings.EqualFold(code, country) {
-			return true
-		}
-	}
-	return false
+	_, ok := h.proxyCountries[country]
+	return ok
 }
 
+// countryHeaders lists geo headers set by CDNs and load balancers, in priority order
+var countryHeaders = []string{"CF-IPCountry", "X-Country-Code", "X-Appengine-Country", "X-Geo-Country"}
+
 func (h *Handler) detectCountry(c *gin.Context) string {
 	if override := strings.TrimSpace(c.DefaultQuery("country", "")); override != "" {
 		return strings.ToUpper(override)
 	}
-	headers := []string{"CF-IPCountry", "X-Country-Code", "X-Appengine-Country", "X-Geo-Country"}
-	for _, header := range headers {
+	for _, header := range countryHeaders {
 		if val := strings.TrimSpace(c.GetHeader(header)); val != "" && val != "ZZ" && val != "XX" {
 			return strings.ToUpper(val)
 		}
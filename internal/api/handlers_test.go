@@ -0,0 +1,60 @@
+package api
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/sirupsen/logrus"
+)
+
+// TestRootResponse tests that the spliced root body is valid JSON with a fresh timestamp
+func TestRootResponse(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	handler := NewHandler(nil, nil, nil, logrus.New(), nil)
+	router := gin.New()
+	router.GET("/", handler.Root)
+
+	before := time.Now()
+	w := httptest.NewRecorder()
+	router.ServeHTTP(w, httptest.NewRequest(http.MethodGet, "/", nil))
+
+	if w.Code != http.StatusOK {
+		t.Fatalf("expected status 200, got %d", w.Code)
+	}
+	if ct := w.Header().Get("Content-Type"); ct != "application/json; charset=utf-8" {
+		t.Errorf("Content-Type = %q, want application/json; charset=utf-8", ct)
+	}
+
+	var body struct {
+		Name               string            `json:"name"`
+		Endpoints          map[string]string `json:"endpoints"`
+		SupportedPlatforms []string          `json:"supported_platforms"`
+		Timestamp          string            `json:"timestamp"`
+	}
+	if err := json.Unmarshal(w.Body.Bytes(), &body); err != nil {
+		t.Fatalf("response is not valid JSON: %v\n%s", err, w.Body.String())
+	}
+
+	if body.Name != "Go Video Streaming API" {
+		t.Errorf("name = %q", body.Name)
+	}
+	if body.Endpoints["health"] != "/api/v2/system/health" {
+		t.Errorf("endpoints = %v, want a health endpoint", body.Endpoints)
+	}
+	if len(body.SupportedPlatforms) == 0 {
+		t.Error("supported_platforms is empty")
+	}
+
+	ts, err := time.Parse(time.RFC3339Nano, body.Timestamp)
+	if err != nil {
+		t.Fatalf("timestamp %q does not parse: %v", body.Timestamp, err)
+	}
+	if ts.Before(before.Add(-time.Second)) || ts.After(time.Now().Add(time.Second)) {
+		t.Errorf("timestamp %v is not the time of the request", ts)
+	}
+}
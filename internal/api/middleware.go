@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"net/http"
 	"runtime/debug"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -26,6 +27,17 @@ const (
 	ValidatedModeKey       = "validated_mode"
 )
 
+// abortWithError writes a standardized error response and stops the middleware chain
+func abortWithError(c *gin.Context, statusCode int, message, detail, code string) {
+	c.AbortWithStatusJSON(statusCode, models.ErrorResponse{
+		Success:   false,
+		Error:     message,
+		Detail:    detail,
+		Code:      code,
+		Timestamp: time.Now(),
+	})
+}
+
 // LoggerMiddleware logs HTTP requests
 func LoggerMiddleware(logger *logrus.Logger) gin.HandlerFunc {
 	return func(c *gin.Context) {
@@ -46,7 +58,7 @@ func LoggerMiddleware(logger *logrus.Logger) gin.HandlerFunc {
 
 		logger.WithFields(logrus.Fields{
 			"status_code": statusCode,
-			"latency_ms":  latency.Milliseconds(),
+			"latency_ms":  float64(latency.Microseconds()) / 1000,
 			"client_ip":   clientIP,
 			"method":      method,
 			"path":        path,
@@ -357,14 +369,7 @@ func ValidationMiddleware(validator InputValidator, logger *logrus.Logger) gin.H
 				}).Warn("Validation failure")
 			}
 
-			c.JSON(http.StatusBadRequest, models.ErrorResponse{
-				Success:   false,
-				Error:     "Validation failed",
-				Detail:    validationErrors[0].Message,
-				Code:      "VALIDATION_ERROR",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusBadRequest, "Validation failed", validationErrors[0].Message, "VALIDATION_ERROR")
 			return
 		}
 
@@ -390,14 +395,7 @@ func SanitizationMiddleware(sanitizer InputSanitizer, logger *logrus.Logger) gin
 					"reason":    "null_or_control_chars",
 				}).Warn("Sanitization rejected request: null bytes or control characters")
 
-				c.JSON(http.StatusBadRequest, models.ErrorResponse{
-					Success:   false,
-					Error:     "Invalid request",
-					Detail:    "Request contains invalid characters",
-					Code:      "INVALID_CHARACTERS",
-					Timestamp: time.Now(),
-				})
-				c.Abort()
+				abortWithError(c, http.StatusBadRequest, "Invalid request", "Request contains invalid characters", "INVALID_CHARACTERS")
 				return
 			}
 
@@ -410,14 +408,7 @@ func SanitizationMiddleware(sanitizer InputSanitizer, logger *logrus.Logger) gin
 					"pattern_type": patternType,
 				}).Warn("Sanitization detected malicious pattern")
 
-				c.JSON(http.StatusBadRequest, models.ErrorResponse{
-					Success:   false,
-					Error:     "Invalid request",
-					Detail:    "Request contains potentially malicious content",
-					Code:      "MALICIOUS_CONTENT",
-					Timestamp: time.Now(),
-				})
-				c.Abort()
+				abortWithError(c, http.StatusBadRequest, "Invalid request", "Request contains potentially malicious content", "MALICIOUS_CONTENT")
 				return
 			}
 		}
@@ -433,14 +424,7 @@ func SanitizationMiddleware(sanitizer InputSanitizer, logger *logrus.Logger) gin
 						"reason":    "null_or_control_chars",
 					}).Warn("Sanitization rejected request: null bytes or control characters in query")
 
-					c.JSON(http.StatusBadRequest, models.ErrorResponse{
-						Success:   false,
-						Error:     "Invalid request",
-						Detail:    "Query parameter contains invalid characters",
-						Code:      "INVALID_CHARACTERS",
-						Timestamp: time.Now(),
-					})
-					c.Abort()
+					abortWithError(c, http.StatusBadRequest, "Invalid request", "Query parameter contains invalid characters", "INVALID_CHARACTERS")
 					return
 				}
 
@@ -453,14 +437,7 @@ func SanitizationMiddleware(sanitizer InputSanitizer, logger *logrus.Logger) gin
 						"pattern_type": patternType,
 					}).Warn("Sanitization detected malicious pattern in query")
 
-					c.JSON(http.StatusBadRequest, models.ErrorResponse{
-						Success:   false,
-						Error:     "Invalid request",
-						Detail:    "Query parameter contains potentially malicious content",
-						Code:      "MALICIOUS_CONTENT",
-						Timestamp: time.Now(),
-					})
-					c.Abort()
+					abortWithError(c, http.StatusBadRequest, "Invalid request", "Query parameter contains potentially malicious content", "MALICIOUS_CONTENT")
 					return
 				}
 			}
@@ -474,14 +451,7 @@ func SanitizationMiddleware(sanitizer InputSanitizer, logger *logrus.Logger) gin
 				"reason":    "null_or_control_chars_in_path",
 			}).Warn("Sanitization rejected request: null bytes or control characters in path")
 
-			c.JSON(http.StatusBadRequest, models.ErrorResponse{
-				Success:   false,
-				Error:     "Invalid request",
-				Detail:    "URL path contains invalid characters",
-				Code:      "INVALID_CHARACTERS",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusBadRequest, "Invalid request", "URL path contains invalid characters", "INVALID_CHARACTERS")
 			return
 		}
 
@@ -506,14 +476,7 @@ func RequestSizeLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logge
 				"path":       c.Request.URL.Path,
 			}).Warn("Request URL exceeds size limit")
 
-			c.JSON(http.StatusRequestEntityTooLarge, models.ErrorResponse{
-				Success:   false,
-				Error:     "Payload Too Large",
-				Detail:    "URL length exceeds maximum allowed",
-				Code:      "URL_TOO_LONG",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusRequestEntityTooLarge, "Payload Too Large", "URL length exceeds maximum allowed", "URL_TOO_LONG")
 			return
 		}
 
@@ -527,14 +490,7 @@ func RequestSizeLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logge
 				"path":         c.Request.URL.Path,
 			}).Warn("Request query string exceeds size limit")
 
-			c.JSON(http.StatusRequestEntityTooLarge, models.ErrorResponse{
-				Success:   false,
-				Error:     "Payload Too Large",
-				Detail:    "Query string length exceeds maximum allowed",
-				Code:      "QUERY_TOO_LONG",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusRequestEntityTooLarge, "Payload Too Large", "Query string length exceeds maximum allowed", "QUERY_TOO_LONG")
 			return
 		}
 
@@ -554,14 +510,7 @@ func RequestSizeLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logge
 				"path":        c.Request.URL.Path,
 			}).Warn("Request headers exceed size limit")
 
-			c.JSON(http.StatusRequestEntityTooLarge, models.ErrorResponse{
-				Success:   false,
-				Error:     "Payload Too Large",
-				Detail:    "Request headers exceed maximum allowed size",
-				Code:      "HEADERS_TOO_LARGE",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusRequestEntityTooLarge, "Payload Too Large", "Request headers exceed maximum allowed size", "HEADERS_TOO_LARGE")
 			return
 		}
 
@@ -575,14 +524,7 @@ func RequestSizeLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logge
 					"path":           c.Request.URL.Path,
 				}).Warn("Request body exceeds size limit")
 
-				c.JSON(http.StatusRequestEntityTooLarge, models.ErrorResponse{
-					Success:   false,
-					Error:     "Payload Too Large",
-					Detail:    "Request body exceeds maximum allowed size",
-					Code:      "BODY_TOO_LARGE",
-					Timestamp: time.Now(),
-				})
-				c.Abort()
+				abortWithError(c, http.StatusRequestEntityTooLarge, "Payload Too Large", "Request body exceeds maximum allowed size", "BODY_TOO_LARGE")
 				return
 			}
 
@@ -620,14 +562,7 @@ func IPAccessControlMiddleware(controller *CIDRAccessController, logger *logrus.
 				"reason":    "blocklist",
 			}).Warn("IP access denied: blocked")
 
-			c.JSON(http.StatusForbidden, models.ErrorResponse{
-				Success:   false,
-				Error:     "Forbidden",
-				Detail:    "Access denied",
-				Code:      "IP_BLOCKED",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusForbidden, "Forbidden", "Access denied", "IP_BLOCKED")
 			return
 		}
 
@@ -639,14 +574,7 @@ func IPAccessControlMiddleware(controller *CIDRAccessController, logger *logrus.
 				"reason":    "not_in_allowlist",
 			}).Warn("IP access denied: not in allowlist")
 
-			c.JSON(http.StatusForbidden, models.ErrorResponse{
-				Success:   false,
-				Error:     "Forbidden",
-				Detail:    "Access denied",
-				Code:      "IP_NOT_ALLOWED",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusForbidden, "Forbidden", "Access denied", "IP_NOT_ALLOWED")
 			return
 		}
 
@@ -687,14 +615,10 @@ func (rl *RateLimiter) cleanup() {
 		case <-rl.cleanupTick.C:
 			rl.mu.Lock()
 			now := time.Now()
+			windowStart := now.Add(-rl.window)
 			for key, times := range rl.requests {
 				// Filter out expired timestamps
-				valid := make([]time.Time, 0)
-				for _, t := range times {
-					if now.Sub(t) < rl.window {
-						valid = append(valid, t)
-					}
-				}
+				valid := pruneExpired(times, windowStart)
 				if len(valid) == 0 {
 					delete(rl.requests, key)
 				} else {
@@ -722,19 +646,8 @@ func (rl *RateLimiter) Allow(key string) (bool, int, time.Duration) {
 	now := time.Now()
 	windowStart := now.Add(-rl.window)
 
-	// Get existing requests for this key
-	times, exists := rl.requests[key]
-	if !exists {
-		times = make([]time.Time, 0)
-	}
-
 	// Filter to only requests within the window
-	valid := make([]time.Time, 0, len(times))
-	for _, t := range times {
-		if t.After(windowStart) {
-			valid = append(valid, t)
-		}
-	}
+	valid := pruneExpired(rl.requests[key], windowStart)
 
 	remaining := rl.maxRequests - len(valid)
 	if remaining <= 0 {
@@ -754,6 +667,17 @@ func (rl *RateLimiter) Allow(key string) (bool, int, time.Duration) {
 	return true, remaining - 1, 0
 }
 
+// pruneExpired drops timestamps at or before windowStart. Timestamps are
+// appended in order, so the expired ones form a prefix and can be resliced
+// away without allocating a new slice.
+func pruneExpired(times []time.Time, windowStart time.Time) []time.Time {
+	i := 0
+	for i < len(times) && !times[i].After(windowStart) {
+		i++
+	}
+	return times[i:]
+}
+
 // RateLimitMiddleware implements rate limiting per IP or globally
 func RateLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logger) gin.HandlerFunc {
 	if !cfg.RateLimitEnabled {
@@ -764,6 +688,10 @@ func RateLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logger) gin.
 
 	limiter := NewRateLimiter(cfg.RateLimitMaxRequests, cfg.RateLimitWindowSecs)
 
+	// Limit and window are fixed for the limiter's lifetime; format them once
+	limitHeader := strconv.Itoa(cfg.RateLimitMaxRequests)
+	windowHeader := strconv.Itoa(cfg.RateLimitWindowSecs)
+
 	return func(c *gin.Context) {
 		var key string
 		if cfg.RateLimitByIP {
@@ -779,9 +707,9 @@ func RateLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logger) gin.
 		allowed, remaining, retryAfter := limiter.Allow(key)
 
 		// Set rate limit headers
-		c.Writer.Header().Set("X-RateLimit-Limit", fmt.Sprintf("%d", cfg.RateLimitMaxRequests))
-		c.Writer.Header().Set("X-RateLimit-Remaining", fmt.Sprintf("%d", remaining))
-		c.Writer.Header().Set("X-RateLimit-Window", fmt.Sprintf("%d", cfg.RateLimitWindowSecs))
+		c.Writer.Header().Set("X-RateLimit-Limit", limitHeader)
+		c.Writer.Header().Set("X-RateLimit-Remaining", strconv.Itoa(remaining))
+		c.Writer.Header().Set("X-RateLimit-Window", windowHeader)
 
 		if !allowed {
 			logger.WithFields(logrus.Fields{
@@ -790,17 +718,11 @@ func RateLimitMiddleware(cfg *config.SecurityConfig, logger *logrus.Logger) gin.
 				"retry_after": retryAfter.Seconds(),
 			}).Warn("Rate limit exceeded")
 
-			c.Writer.Header().Set("Retry-After", fmt.Sprintf("%d", int(retryAfter.Seconds())+1))
+			retrySecs := strconv.Itoa(int(retryAfter.Seconds()) + 1)
+			c.Writer.Header().Set("Retry-After", retrySecs)
 			c.Writer.Header().Set("X-RateLimit-Remaining", "0")
 
-			c.JSON(http.StatusTooManyRequests, models.ErrorResponse{
-				Success:   false,
-				Error:     "Too Many Requests",
-				Detail:    fmt.Sprintf("Rate limit exceeded. Try again in %d seconds", int(retryAfter.Seconds())+1),
-				Code:      "RATE_LIMIT_EXCEEDED",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusTooManyRequests, "Too Many Requests", "Rate limit exceeded. Try again in "+retrySecs+" seconds", "RATE_LIMIT_EXCEEDED")
 			return
 		}
 
@@ -857,14 +779,7 @@ func APIKeyAuthMiddleware(cfg *config.SecurityConfig, logger *logrus.Logger) gin
 				"path":      c.Request.URL.Path,
 			}).Warn("API key missing")
 
-			c.JSON(http.StatusUnauthorized, models.ErrorResponse{
-				Success:   false,
-				Error:     "Unauthorized",
-				Detail:    "API key is required",
-				Code:      "API_KEY_MISSING",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusUnauthorized, "Unauthorized", "API key is required", "API_KEY_MISSING")
 			return
 		}
 
@@ -874,14 +789,7 @@ func APIKeyAuthMiddleware(cfg *config.SecurityConfig, logger *logrus.Logger) gin
 				"path":      c.Request.URL.Path,
 			}).Warn("Invalid API key")
 
-			c.JSON(http.StatusUnauthorized, models.ErrorResponse{
-				Success:   false,
-				Error:     "Unauthorized",
-				Detail:    "Invalid API key",
-				Code:      "API_KEY_INVALID",
-				Timestamp: time.Now(),
-			})
-			c.Abort()
+			abortWithError(c, http.StatusUnauthorized, "Unauthorized", "Invalid API key", "API_KEY_INVALID")
 			return
 		}
 
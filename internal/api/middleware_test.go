@@ -0,0 +1,98 @@
+package api
+
+import (
+	"testing"
+	"time"
+)
+
+func TestPruneExpired(t *testing.T) {
+	base := time.Date(2024, 1, 1, 0, 0, 0, 0, time.UTC)
+	at := func(secs ...int) []time.Time {
+		times := make([]time.Time, len(secs))
+		for i, s := range secs {
+			times[i] = base.Add(time.Duration(s) * time.Second)
+		}
+		return times
+	}
+
+	tests := []struct {
+		name        string
+		times       []time.Time
+		windowStart time.Time
+		expected    []time.Time
+	}{
+		{
+			name:        "empty slice",
+			times:       nil,
+			windowStart: base,
+			expected:    nil,
+		},
+		{
+			name:        "all expired",
+			times:       at(1, 2, 3),
+			windowStart: base.Add(5 * time.Second),
+			expected:    nil,
+		},
+		{
+			name:        "none expired",
+			times:       at(6, 7, 8),
+			windowStart: base.Add(5 * time.Second),
+			expected:    at(6, 7, 8),
+		},
+		{
+			name:        "timestamp equal to window start is expired",
+			times:       at(4, 5, 6),
+			windowStart: base.Add(5 * time.Second),
+			expected:    at(6),
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result := pruneExpired(tt.times, tt.windowStart)
+			if len(result) != len(tt.expected) {
+				t.Fatalf("pruneExpired() kept %d timestamps, want %d", len(result), len(tt.expected))
+			}
+			for i := range result {
+				if !result[i].Equal(tt.expected[i]) {
+					t.Errorf("pruneExpired()[%d] = %v, want %v", i, result[i], tt.expected[i])
+				}
+			}
+		})
+	}
+}
+
+func TestRateLimiter_Allow(t *testing.T) {
+	rl := NewRateLimiter(2, 1)
+	defer rl.Stop()
+	// NewRateLimiter only takes whole seconds; shorten the window for the test
+	rl.mu.Lock()
+	rl.window = 100 * time.Millisecond
+	rl.mu.Unlock()
+
+	for i, wantRemaining := range []int{1, 0} {
+		allowed, remaining, _ := rl.Allow("client")
+		if !allowed || remaining != wantRemaining {
+			t.Fatalf("request %d: Allow() = %v, %d, want true, %d", i+1, allowed, remaining, wantRemaining)
+		}
+	}
+
+	allowed, remaining, retryAfter := rl.Allow("client")
+	if allowed || remaining != 0 {
+		t.Fatalf("request over the limit: Allow() = %v, %d, want false, 0", allowed, remaining)
+	}
+	if retryAfter <= 0 || retryAfter > rl.window {
+		t.Errorf("retryAfter = %v, want within (0, %v]", retryAfter, rl.window)
+	}
+
+	// Other keys have their own window
+	if allowed, _, _ := rl.Allow("other"); !allowed {
+		t.Error("a different key was limited by another key's requests")
+	}
+
+	// Once the whole window has passed, the earlier requests no longer count
+	time.Sleep(rl.window + 10*time.Millisecond)
+	if allowed, remaining, _ := rl.Allow("client"); !allowed || remaining != 1 {
+		t.Errorf("after the window expired: Allow() = %v, %d, want true, 1", allowed, remaining)
+	}
+}
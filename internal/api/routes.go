@@ -98,6 +98,7 @@ func setupCommonRoutes(router *gin.Engine, handler *Handler) {
 		stream := v2.Group("/stream")
 		{
 			stream.GET("/:platform/*video_id", handler.StreamVideo)
+			stream.HEAD("/:platform/*video_id", handler.StreamVideo)
 			stream.GET("/metrics", handler.GetStreamMetrics)
 		}
 
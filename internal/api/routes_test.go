@@ -0,0 +1,38 @@
+package api
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"testing"
+
+	"video-streaming-api/internal/services"
+
+	"github.com/gin-gonic/gin"
+	"github.com/sirupsen/logrus"
+)
+
+// TestStreamRouteAcceptsHEAD tests that player HEAD probes reach the stream handler
+func TestStreamRouteAcceptsHEAD(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	logger := logrus.New()
+	logger.SetLevel(logrus.ErrorLevel)
+
+	router := gin.New()
+	handler := NewHandler(&services.VideoService{}, nil, nil, logger, nil)
+	SetupRoutes(router, handler, logger)
+
+	// An unsupported platform is rejected by the handler before any upstream
+	// work, so the status shows whether the request was routed at all
+	for _, method := range []string{http.MethodGet, http.MethodHead} {
+		t.Run(method, func(t *testing.T) {
+			w := httptest.NewRecorder()
+			req := httptest.NewRequest(method, "/api/v2/stream/unsupported/abc123", nil)
+			router.ServeHTTP(w, req)
+
+			if w.Code != http.StatusBadRequest {
+				t.Errorf("%s: expected status 400 from the stream handler, got %d", method, w.Code)
+			}
+		})
+	}
+}
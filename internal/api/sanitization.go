@@ -17,57 +17,72 @@ type InputSanitizer interface {
 
 // DefaultInputSanitizer implements InputSanitizer with security-focused rules.
 type DefaultInputSanitizer struct {
-	pathTraversalPatterns  []*regexp.Regexp
-	sqlInjectionPatterns   []*regexp.Regexp
-	xssPatterns            []*regexp.Regexp
-	commandInjectionPatterns []*regexp.Regexp
+	pathTraversalPatterns   []*regexp.Regexp
+	sqlInjectionMatcher     *regexp.Regexp
+	xssMatcher              *regexp.Regexp
+	commandInjectionMatcher *regexp.Regexp
 }
 
-// NewDefaultInputSanitizer creates a new sanitizer with compiled patterns.
+// Pattern sets are compiled once at package initialisation and shared by every
+// sanitizer instance.
+var (
+	defaultPathTraversalPatterns = compilePatterns([]string{
+		`\.\.\/`,           // ../
+		`\.\.\\`,           // ..\
+		`\.\.%2[fF]`,       // ..%2f or ..%2F (URL encoded /)
+		`\.\.%5[cC]`,       // ..%5c or ..%5C (URL encoded \)
+		`%2[eE]%2[eE]\/`,   // %2e%2e/ (double URL encoded ..)
+		`%2[eE]%2[eE]\\`,   // %2e%2e\ (double URL encoded ..)
+	})
+	defaultSQLInjectionPatterns = compilePatterns([]string{
+		`(?i)'\s*;\s*drop\s+`,
+		`(?i)'\s*;\s*delete\s+`,
+		`(?i)'\s*;\s*update\s+`,
+		`(?i)'\s*;\s*insert\s+`,
+		`(?i)union\s+select`,
+		`(?i)union\s+all\s+select`,
+		`(?i)'\s*or\s+'?\d*'?\s*=\s*'?\d*`,
+		`(?i)'\s*or\s+1\s*=\s*1`,
+		`(?i)--\s*$`,
+		`(?i)/\*.*\*/`,
+	})
+	defaultXSSPatterns = compilePatterns([]string{
+		`(?i)<script[^>]*>`,
+		`(?i)</script>`,
+		`(?i)javascript\s*:`,
+		`(?i)on\w+\s*=`,
+		`(?i)<iframe[^>]*>`,
+		`(?i)<object[^>]*>`,
+		`(?i)<embed[^>]*>`,
+		`(?i)<svg[^>]*onload`,
+		`(?i)expression\s*\(`,
+		`(?i)vbscript\s*:`,
+	})
+	defaultCommandInjectionPatterns = compilePatterns([]string{
+		`;\s*\w+`,           // ; command
+		`\|\s*\w+`,          // | command
+		`\$\([^)]+\)`,       // $(command)
+		"\\x60[^`]+\\x60",   // `command`
+		`&&\s*\w+`,          // && command
+		`\|\|\s*\w+`,        // || command
+		`>\s*\/`,            // > /path (redirect)
+		`<\s*\/`,            // < /path (input redirect)
+	})
+
+	// Detection only needs to know whether any pattern in a category matches,
+	// so each category is fused into one alternation and scanned once.
+	defaultSQLInjectionMatcher     = combinePatterns(defaultSQLInjectionPatterns)
+	defaultXSSMatcher              = combinePatterns(defaultXSSPatterns)
+	defaultCommandInjectionMatcher = combinePatterns(defaultCommandInjectionPatterns)
+)
+
+// NewDefaultInputSanitizer creates a new sanitizer using the shared compiled patterns.
 func NewDefaultInputSanitizer() *DefaultInputSanitizer {
 	return &DefaultInputSanitizer{
-		pathTraversalPatterns: compilePatterns([]string{
-			`\.\.\/`,           // ../
-			`\.\.\\`,           // ..\
-			`\.\.%2[fF]`,       // ..%2f or ..%2F (URL encoded /)
-			`\.\.%5[cC]`,       // ..%5c or ..%5C (URL encoded \)
-			`%2[eE]%2[eE]\/`,   // %2e%2e/ (double URL encoded ..)
-			`%2[eE]%2[eE]\\`,   // %2e%2e\ (double URL encoded ..)
-		}),
-		sqlInjectionPatterns: compilePatterns([]string{
-			`(?i)'\s*;\s*drop\s+`,
-			`(?i)'\s*;\s*delete\s+`,
-			`(?i)'\s*;\s*update\s+`,
-			`(?i)'\s*;\s*insert\s+`,
-			`(?i)union\s+select`,
-			`(?i)union\s+all\s+select`,
-			`(?i)'\s*or\s+'?\d*'?\s*=\s*'?\d*`,
-			`(?i)'\s*or\s+1\s*=\s*1`,
-			`(?i)--\s*$`,
-			`(?i)/\*.*\*/`,
-		}),
-		xssPatterns: compilePatterns([]string{
-			`(?i)<script[^>]*>`,
-			`(?i)</script>`,
-			`(?i)javascript\s*:`,
-			`(?i)on\w+\s*=`,
-			`(?i)<iframe[^>]*>`,
-			`(?i)<object[^>]*>`,
-			`(?i)<embed[^>]*>`,
-			`(?i)<svg[^>]*onload`,
-			`(?i)expression\s*\(`,
-			`(?i)vbscript\s*:`,
-		}),
-		commandInjectionPatterns: compilePatterns([]string{
-			`;\s*\w+`,           // ; command
-			`\|\s*\w+`,          // | command
-			`\$\([^)]+\)`,       // $(command)
-			"\\x60[^`]+\\x60",   // `command`
-			`&&\s*\w+`,          // && command
-			`\|\|\s*\w+`,        // || command
-			`>\s*\/`,            // > /path (redirect)
-			`<\s*\/`,            // < /path (input redirect)
-		}),
+		pathTraversalPatterns:   defaultPathTraversalPatterns,
+		sqlInjectionMatcher:     defaultSQLInjectionMatcher,
+		xssMatcher:              defaultXSSMatcher,
+		commandInjectionMatcher: defaultCommandInjectionMatcher,
 	}
 }
 
@@ -110,13 +125,28 @@ func (s *DefaultInputSanitizer) SanitizePath(path string) (string, error) {
 	sanitized = strings.ReplaceAll(sanitized, "..\\", "")
 
 	// Clean up any double slashes that might result
-	for strings.Contains(sanitized, "//") {
-		sanitized = strings.ReplaceAll(sanitized, "//", "/")
-	}
+	sanitized = collapseSlashes(sanitized)
 
 	return sanitized, nil
 }
 
+// collapseSlashes replaces every run of consecutive slashes with a single slash in one pass.
+func collapseSlashes(s string) string {
+	if !strings.Contains(s, "//") {
+		return s
+	}
+
+	var b strings.Builder
+	b.Grow(len(s))
+	for i := 0; i < len(s); i++ {
+		if s[i] == '/' && i > 0 && s[i-1] == '/' {
+			continue
+		}
+		b.WriteByte(s[i])
+	}
+	return b.String()
+}
+
 // SanitizeURL decodes and validates URL-encoded values.
 // Requirements: 2.2
 func (s *DefaultInputSanitizer) SanitizeURL(rawURL string) (string, error) {
@@ -182,28 +212,48 @@ func (s *DefaultInputSanitizer) SanitizeParameter(param string) (string, error)
 	return sanitized, nil
 }
 
+// isPlainInput reports whether input consists only of alphanumerics and
+// "_.~-/" with no "--". Every malicious pattern needs at least one other
+// character (quote, whitespace, '<', '=', ';', '|', '$', ...) or a "--"
+// comment, so such input can skip the regex scan entirely.
+func isPlainInput(input string) bool {
+	for i := 0; i < len(input); i++ {
+		c := input[i]
+		switch {
+		case c >= 'a' && c <= 'z', c >= 'A' && c <= 'Z', c >= '0' && c <= '9':
+		case c == '_', c == '.', c == '~', c == '/':
+		case c == '-':
+			if i > 0 && input[i-1] == '-' {
+				return false
+			}
+		default:
+			return false
+		}
+	}
+	return true
+}
+
 // DetectMaliciousPatterns checks for SQL injection, XSS, and command injection patterns.
 // Requirements: 2.4
 func (s *DefaultInputSanitizer) DetectMaliciousPatterns(input string) (bool, string) {
+	// Typical IDs, paths and quality values cannot match any pattern
+	if isPlainInput(input) {
+		return false, ""
+	}
+
 	// Check for SQL injection
-	for _, pattern := range s.sqlInjectionPatterns {
-		if pattern.MatchString(input) {
-			return true, "sql_injection"
-		}
+	if s.sqlInjectionMatcher.MatchString(input) {
+		return true, "sql_injection"
 	}
 
 	// Check for XSS
-	for _, pattern := range s.xssPatterns {
-		if pattern.MatchString(input) {
-			return true, "xss"
-		}
+	if s.xssMatcher.MatchString(input) {
+		return true, "xss"
 	}
 
 	// Check for command injection
-	for _, pattern := range s.commandInjectionPatterns {
-		if pattern.MatchString(input) {
-			return true, "command_injection"
-		}
+	if s.commandInjectionMatcher.MatchString(input) {
+		return true, "command_injection"
 	}
 
 	return false, ""
@@ -212,13 +262,16 @@ func (s *DefaultInputSanitizer) DetectMaliciousPatterns(input string) (bool, str
 // ContainsNullOrControlChars checks for null bytes and control characters.
 // Requirements: 2.4
 func (s *DefaultInputSanitizer) ContainsNullOrControlChars(input string) bool {
-	for _, r := range input {
-		// Check for null byte
-		if r == 0 {
-			return true
+	// Scan bytes rather than decoding runes: every byte of a multi-byte UTF-8
+	// sequence is >= 0x80, so only single-byte characters can be controls
+	for i := 0; i < len(input); i++ {
+		b := input[i]
+		if b >= 0x20 {
+			continue
 		}
-		// Check for control characters (0x01-0x1F) except tab (0x09), newline (0x0A), carriage return (0x0D)
-		if r >= 0x01 && r <= 0x1F && r != 0x09 && r != 0x0A && r != 0x0D {
+		// Null byte and control characters (0x01-0x1F) except tab (0x09),
+		// newline (0x0A), carriage return (0x0D)
+		if b != 0x09 && b != 0x0A && b != 0x0D {
 			return true
 		}
 	}
@@ -3,6 +3,7 @@ package api
 import (
 	"net/http"
 	"net/http/httptest"
+	"regexp"
 	"strings"
 	"testing"
 
@@ -95,6 +96,21 @@ func TestProperty4_PathTraversalSequencesAreRemoved(t *testing.T) {
 		gen.RegexMatch("[a-zA-Z0-9]{1,50}"),
 	))
 
+	// Property: Runs of slashes collapse to a single slash
+	properties.Property("slash runs collapse to a single slash", prop.ForAll(
+		func(prefix, suffix string, count int) bool {
+			input := prefix + strings.Repeat("/", count) + suffix
+			result, err := sanitizer.SanitizePath(input)
+			if err != nil {
+				return true
+			}
+			return result == prefix+"/"+suffix
+		},
+		gen.RegexMatch("[a-zA-Z0-9]{0,10}"),
+		gen.RegexMatch("[a-zA-Z0-9]{0,10}"),
+		gen.IntRange(1, 20),
+	))
+
 	properties.TestingRun(t)
 }
 
@@ -256,3 +272,41 @@ func TestProperty6_NullBytesAndControlCharsAreRejected(t *testing.T) {
 
 	properties.TestingRun(t)
 }
+
+// The plain-input fast path in DetectMaliciousPatterns must never skip an
+// input that one of the compiled patterns would flag.
+func TestPlainInputPrefilterIsSound(t *testing.T) {
+	parameters := gopter.DefaultTestParameters()
+	parameters.MinSuccessfulTests = 500
+
+	properties := gopter.NewProperties(parameters)
+
+	allPatterns := append(append(append([]*regexp.Regexp{},
+		defaultSQLInjectionPatterns...),
+		defaultXSSPatterns...),
+		defaultCommandInjectionPatterns...)
+
+	properties.Property("plain inputs match no malicious pattern", prop.ForAll(
+		func(input string) bool {
+			if !isPlainInput(input) {
+				return true
+			}
+			for _, pattern := range allPatterns {
+				if pattern.MatchString(input) {
+					return false
+				}
+			}
+			return true
+		},
+		gen.RegexMatch(`[a-zA-Z0-9_.~/\-]{0,30}`),
+	))
+
+	properties.Property("-- comments are not treated as plain", prop.ForAll(
+		func(prefix string) bool {
+			return !isPlainInput(prefix + "--")
+		},
+		gen.RegexMatch("[a-zA-Z0-9]{0,10}"),
+	))
+
+	properties.TestingRun(t)
+}
@@ -2,7 +2,6 @@ package api
 
 import (
 	"fmt"
-	"regexp"
 	"strings"
 
 	"video-streaming-api/internal/config"
@@ -38,11 +37,31 @@ type DefaultInputValidator struct {
 	maxPlaylistIDLength int
 }
 
-// videoIDPattern matches alphanumeric, hyphens, underscores, and URL-safe characters.
-var videoIDPattern = regexp.MustCompile(`^[a-zA-Z0-9_\-]+$`)
+// isVideoIDChars reports whether s is non-empty and consists only of
+// alphanumerics, hyphens, and underscores. It is the hot-path equivalent of
+// matching `^[a-zA-Z0-9_\-]+$` without going through the regexp engine.
+func isVideoIDChars(s string) bool {
+	if s == "" {
+		return false
+	}
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		switch {
+		case c >= 'a' && c <= 'z', c >= 'A' && c <= 'Z', c >= '0' && c <= '9', c == '_', c == '-':
+		default:
+			return false
+		}
+	}
+	return true
+}
 
-// countryCodePattern matches valid 2-letter ISO country codes.
-var countryCodePattern = regexp.MustCompile(`^[A-Z]{2}$`)
+// isCountryCode reports whether s is exactly two upper-case ASCII letters,
+// equivalent to matching `^[A-Z]{2}$`.
+func isCountryCode(s string) bool {
+	return len(s) == 2 &&
+		s[0] >= 'A' && s[0] <= 'Z' &&
+		s[1] >= 'A' && s[1] <= 'Z'
+}
 
 // NewDefaultInputValidator creates a new validator with the given security config.
 func NewDefaultInputValidator(cfg *config.SecurityConfig) *DefaultInputValidator {
@@ -111,7 +130,7 @@ func (v *DefaultInputValidator) ValidateVideoID(videoID string) error {
 		}
 	}
 
-	if !videoIDPattern.MatchString(videoID) {
+	if !isVideoIDChars(videoID) {
 		return &ValidationError{
 			Field:   "video_id",
 			Value:   videoID,
@@ -144,7 +163,7 @@ func (v *DefaultInputValidator) ValidatePlaylistID(playlistID string) error {
 		}
 	}
 
-	if !videoIDPattern.MatchString(playlistID) {
+	if !isVideoIDChars(playlistID) {
 		return &ValidationError{
 			Field:   "playlist_id",
 			Value:   playlistID,
@@ -186,7 +205,7 @@ func (v *DefaultInputValidator) ValidateCountryCode(code string) error {
 	}
 
 	normalized := strings.ToUpper(strings.TrimSpace(code))
-	if !countryCodePattern.MatchString(normalized) {
+	if !isCountryCode(normalized) {
 		return &ValidationError{
 			Field:   "country",
 			Value:   code,
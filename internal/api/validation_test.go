@@ -3,6 +3,7 @@ package api
 import (
 	"net/http"
 	"net/http/httptest"
+	"regexp"
 	"strings"
 	"testing"
 	"video-streaming-api/internal/config"
@@ -353,6 +354,12 @@ func TestProperty2_ValidationFailuresReturn400WithDescriptiveErrors(t *testing.T
 
 // Helper functions
 
+// videoIDPattern is the reference definition isVideoIDChars must agree with.
+var videoIDPattern = regexp.MustCompile(`^[a-zA-Z0-9_\-]+$`)
+
+// countryCodePattern is the reference definition isCountryCode must agree with.
+var countryCodePattern = regexp.MustCompile(`^[A-Z]{2}$`)
+
 func testSecurityConfig() *config.SecurityConfig {
 	return &config.SecurityConfig{
 		MaxVideoIDLength:    200,
@@ -18,11 +18,14 @@ type Config struct {
 	RedisPort         string
 	RedisPassword     string
 	RedisDB           int
+	RedisPoolSize     int
+	RedisMinIdleConns int
 	VideoInfoTTL      time.Duration
 	StreamURLTTL      time.Duration
 	SmartProxyEnabled bool
 	ProxyCountries    []string
 	DefaultStreamMode string
+	UpstreamIdleConns int
 	Security          SecurityConfig
 }
 
@@ -97,6 +100,11 @@ func Load() *Config {
 	}
 
 	cfg.RedisDB = parseInt(getEnv("REDIS_DB", "0"), 0)
+	// A pool size of 0 keeps the go-redis default of 10 connections per CPU
+	cfg.RedisPoolSize = parseInt(getEnv("REDIS_POOL_SIZE", "0"), 0)
+	cfg.RedisMinIdleConns = parseInt(getEnv("REDIS_MIN_IDLE_CONNS", "0"), 0)
+	// Kept-alive connections per upstream CDN host when proxying streams
+	cfg.UpstreamIdleConns = parseInt(getEnv("UPSTREAM_MAX_IDLE_CONNS_PER_HOST", "64"), 64)
 	return cfg
 }
 
@@ -368,3 +368,62 @@ func validSecurityConfig() SecurityConfig {
 		ExposeDetailedErrors: false,
 	}
 }
+
+func TestLoadConnectionPoolSettings(t *testing.T) {
+	tests := []struct {
+		name              string
+		env               map[string]string
+		poolSize          int
+		minIdleConns      int
+		upstreamIdleConns int
+	}{
+		{
+			name:              "defaults when unset",
+			env:               map[string]string{},
+			poolSize:          0,
+			minIdleConns:      0,
+			upstreamIdleConns: 64,
+		},
+		{
+			name: "values are parsed",
+			env: map[string]string{
+				"REDIS_POOL_SIZE":                  "50",
+				"REDIS_MIN_IDLE_CONNS":             "5",
+				"UPSTREAM_MAX_IDLE_CONNS_PER_HOST": "128",
+			},
+			poolSize:          50,
+			minIdleConns:      5,
+			upstreamIdleConns: 128,
+		},
+		{
+			name: "invalid values fall back to defaults",
+			env: map[string]string{
+				"REDIS_POOL_SIZE":                  "many",
+				"REDIS_MIN_IDLE_CONNS":             "1.5",
+				"UPSTREAM_MAX_IDLE_CONNS_PER_HOST": "lots",
+			},
+			poolSize:          0,
+			minIdleConns:      0,
+			upstreamIdleConns: 64,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			for _, key := range []string{"REDIS_POOL_SIZE", "REDIS_MIN_IDLE_CONNS", "UPSTREAM_MAX_IDLE_CONNS_PER_HOST"} {
+				t.Setenv(key, tt.env[key])
+			}
+
+			cfg := Load()
+			if cfg.RedisPoolSize != tt.poolSize {
+				t.Errorf("RedisPoolSize = %d, want %d", cfg.RedisPoolSize, tt.poolSize)
+			}
+			if cfg.RedisMinIdleConns != tt.minIdleConns {
+				t.Errorf("RedisMinIdleConns = %d, want %d", cfg.RedisMinIdleConns, tt.minIdleConns)
+			}
+			if cfg.UpstreamIdleConns != tt.upstreamIdleConns {
+				t.Errorf("UpstreamIdleConns = %d, want %d", cfg.UpstreamIdleConns, tt.upstreamIdleConns)
+			}
+		})
+	}
+}
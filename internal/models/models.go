@@ -144,7 +144,9 @@ type SuccessResponse struct {
 	Timestamp time.Time   `json:"timestamp"`
 }
 
-// StreamMetrics represents streaming performance metrics
+// StreamMetrics represents streaming performance metrics. AverageLatencyMs is
+// the mean time to upstream response headers for proxied streams, excluding
+// stream URL resolution.
 type StreamMetrics struct {
 	TotalRequests    int64   `json:"total_requests"`
 	CacheHits        int64   `json:"cache_hits"`
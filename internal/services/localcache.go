@@ -0,0 +1,82 @@
+package services
+
+import (
+	"container/list"
+	"sync"
+	"time"
+)
+
+// localCache is a small in-process LRU cache with a fixed TTL per entry.
+// It sits in front of Redis for hot keys; Redis remains the source of truth.
+type localCache struct {
+	mu       sync.Mutex
+	ttl      time.Duration
+	capacity int
+	order    *list.List
+	items    map[string]*list.Element
+}
+
+type localCacheEntry struct {
+	key       string
+	value     string
+	expiresAt time.Time
+}
+
+// newLocalCache creates a cache holding at most capacity entries for ttl each
+func newLocalCache(capacity int, ttl time.Duration) *localCache {
+	return &localCache{
+		ttl:      ttl,
+		capacity: capacity,
+		order:    list.New(),
+		items:    make(map[string]*list.Element, capacity),
+	}
+}
+
+// Get returns the cached value for key if present and not expired
+func (c *localCache) Get(key string) (string, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.items[key]
+	if !ok {
+		return "", false
+	}
+
+	entry := elem.Value.(*localCacheEntry)
+	if time.Now().After(entry.expiresAt) {
+		c.order.Remove(elem)
+		delete(c.items, key)
+		return "", false
+	}
+
+	c.order.MoveToFront(elem)
+	return entry.value, true
+}
+
+// Set stores value under key, evicting the least recently used entry when full
+func (c *localCache) Set(key, value string) {
+	if c.capacity <= 0 || c.ttl <= 0 {
+		return
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	expiresAt := time.Now().Add(c.ttl)
+	if elem, ok := c.items[key]; ok {
+		entry := elem.Value.(*localCacheEntry)
+		entry.value = value
+		entry.expiresAt = expiresAt
+		c.order.MoveToFront(elem)
+		return
+	}
+
+	if c.order.Len() >= c.capacity {
+		if oldest := c.order.Back(); oldest != nil {
+			c.order.Remove(oldest)
+			delete(c.items, oldest.Value.(*localCacheEntry).key)
+		}
+	}
+
+	c.items[key] = c.order.PushFront(&localCacheEntry{key: key, value: value, expiresAt: expiresAt})
+}
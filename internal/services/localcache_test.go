@@ -0,0 +1,63 @@
+package services
+
+import (
+	"testing"
+	"time"
+)
+
+func TestLocalCache_GetSet(t *testing.T) {
+	cache := newLocalCache(2, time.Minute)
+
+	if _, ok := cache.Get("missing"); ok {
+		t.Fatal("Get() on empty cache reported a hit")
+	}
+
+	cache.Set("a", "1")
+	if got, ok := cache.Get("a"); !ok || got != "1" {
+		t.Errorf("Get(a) = %q, %v, want %q, true", got, ok, "1")
+	}
+
+	cache.Set("a", "2")
+	if got, _ := cache.Get("a"); got != "2" {
+		t.Errorf("Get(a) after overwrite = %q, want %q", got, "2")
+	}
+}
+
+func TestLocalCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	cache := newLocalCache(2, time.Minute)
+
+	cache.Set("a", "1")
+	cache.Set("b", "2")
+	cache.Get("a") // a is now more recently used than b
+	cache.Set("c", "3")
+
+	if _, ok := cache.Get("b"); ok {
+		t.Error("least recently used entry b was not evicted")
+	}
+	if _, ok := cache.Get("a"); !ok {
+		t.Error("recently used entry a was evicted")
+	}
+	if _, ok := cache.Get("c"); !ok {
+		t.Error("newest entry c is missing")
+	}
+}
+
+func TestLocalCache_Expiry(t *testing.T) {
+	cache := newLocalCache(10, time.Millisecond)
+
+	cache.Set("a", "1")
+	time.Sleep(5 * time.Millisecond)
+
+	if _, ok := cache.Get("a"); ok {
+		t.Error("expired entry was returned")
+	}
+}
+
+func BenchmarkLocalCacheGet(b *testing.B) {
+	cache := newLocalCache(1024, time.Minute)
+	cache.Set("stream:youtube:abc123:720p", "https://example.com/video.mp4")
+
+	for i := 0; i < b.N; i++ {
+		cache.Get("stream:youtube:abc123:720p")
+	}
+}
@@ -4,6 +4,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"strings"
 	"time"
 
 	"github.com/redis/go-redis/v9"
@@ -24,6 +25,9 @@ func NewRedisService(cfg *config.Config, logger *logrus.Logger) *RedisService {
 		Addr:     fmt.Sprintf("%s:%s", cfg.RedisHost, cfg.RedisPort),
 		Password: cfg.RedisPassword,
 		DB:       cfg.RedisDB,
+
+		PoolSize:     cfg.RedisPoolSize,
+		MinIdleConns: cfg.RedisMinIdleConns,
 	})
 
 	return &RedisService{
@@ -63,12 +67,16 @@ func (s *RedisService) SetJSON(ctx context.Context, key string, value interface{
 
 // GetJSON retrieves and decodes a JSON value from Redis
 func (s *RedisService) GetJSON(ctx context.Context, key string, dest interface{}) error {
-	val, err := s.Get(ctx, key)
+	// Read the reply as bytes so it is not copied into a string and back
+	val, err := s.client.Get(ctx, key).Bytes()
+	if err == redis.Nil {
+		return fmt.Errorf("key not found: %s", key)
+	}
 	if err != nil {
 		return err
 	}
 
-	if err := json.Unmarshal([]byte(val), dest); err != nil {
+	if err := json.Unmarshal(val, dest); err != nil {
 		return fmt.Errorf("failed to unmarshal JSON: %w", err)
 	}
 	return nil
@@ -120,9 +128,22 @@ func (s *RedisService) Close() error {
 
 // GenerateCacheKey generates a cache key from components
 func GenerateCacheKey(prefix string, parts ...string) string {
-	key := prefix
+	if len(parts) == 0 {
+		return prefix
+	}
+
+	// Size the buffer up front so the key is built with a single allocation
+	n := len(prefix) + len(parts)
+	for _, part := range parts {
+		n += len(part)
+	}
+
+	var b strings.Builder
+	b.Grow(n)
+	b.WriteString(prefix)
 	for _, part := range parts {
-		key += ":" + part
+		b.WriteByte(':')
+		b.WriteString(part)
 	}
-	return key
+	return b.String()
 }
@@ -6,6 +6,7 @@ import (
 	"io"
 	"net/http"
 	"strings"
+	"sync"
 	"sync/atomic"
 	"time"
 
@@ -16,6 +17,19 @@ import (
 	"github.com/sirupsen/logrus"
 )
 
+// streamCopyBufferSize is the chunk size used when relaying upstream bodies.
+// io.Copy's default 32 KiB means many small writes per megabyte of video.
+const streamCopyBufferSize = 256 * 1024
+
+// streamBufferPool recycles relay buffers so each stream does not allocate
+// (and later hand to the GC) its own 256 KiB slice
+var streamBufferPool = sync.Pool{
+	New: func() interface{} {
+		buf := make([]byte, streamCopyBufferSize)
+		return &buf
+	},
+}
+
 // StreamingService handles video streaming operations
 type StreamingService struct {
 	video  *VideoService
@@ -23,36 +37,66 @@ type StreamingService struct {
 	cfg    *config.Config
 	logger *logrus.Logger
 
+	// httpClient is shared across requests so upstream connections are kept alive and reused
+	httpClient *http.Client
+
 	// Metrics
 	totalRequests    int64
 	cacheHits        int64
 	cacheMisses      int64
 	totalBytesServed int64
 	activeStreams    int32
+
+	// Time from sending the upstream request to receiving its response
+	// headers, summed over proxied streams. Stream URL resolution (Redis,
+	// yt-dlp) is excluded so cold and cached lookups do not skew the mean.
+	totalLatencyMicros int64
+	latencySamples     int64
 }
 
 // NewStreamingService creates a new streaming service
 func NewStreamingService(video *VideoService, redis *RedisService, cfg *config.Config, logger *logrus.Logger) *StreamingService {
+	// Streams are fetched from a handful of CDN hosts, so the default limit of
+	// two idle connections per host would force new handshakes under load
+	// (config.Load defaults UPSTREAM_MAX_IDLE_CONNS_PER_HOST to 64)
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = cfg.UpstreamIdleConns
+	transport.MaxIdleConns = transport.MaxIdleConnsPerHost * 4
+	transport.IdleConnTimeout = 90 * time.Second
+	// Larger read buffers cut read syscalls per stream. This only affects
+	// HTTP/1.1 upstreams; HTTP/2 connections manage their own buffering.
+	transport.ReadBufferSize = 64 * 1024
+
 	return &StreamingService{
 		video:  video,
 		redis:  redis,
 		cfg:    cfg,
 		logger: logger,
+		httpClient: &http.Client{
+			Transport: transport,
+			Timeout:   30 * time.Second,
+		},
 	}
 }
 
 // StreamVideo streams a video through the proxy
 func (s *StreamingService) StreamVideo(c *gin.Context, platform, videoID, quality string, isPlaylist bool) error {
-	atomic.AddInt64(&s.totalRequests, 1)
-	atomic.AddInt32(&s.activeStreams, 1)
-	defer atomic.AddInt32(&s.activeStreams, -1)
+	// HEAD probes from players are not streams, so they stay out of the metrics
+	probe := c.Request.Method == http.MethodHead
+	if !probe {
+		atomic.AddInt64(&s.totalRequests, 1)
+		atomic.AddInt32(&s.activeStreams, 1)
+		defer atomic.AddInt32(&s.activeStreams, -1)
+	}
 
 	startTime := time.Now()
 
 	// Get stream URL
 	streamURL, err := s.video.GetStreamURL(c.Request.Context(), platform, videoID, quality)
 	if err != nil {
-		atomic.AddInt64(&s.cacheMisses, 1)
+		if !probe {
+			atomic.AddInt64(&s.cacheMisses, 1)
+		}
 		return fmt.Errorf("failed to get stream URL: %w", err)
 	}
 
@@ -68,15 +112,23 @@ func (s *StreamingService) StreamVideo(c *gin.Context, platform, videoID, qualit
 		return fmt.Errorf("m3u8 format not supported for non-playlist content")
 	}
 
-	atomic.AddInt64(&s.cacheHits, 1)
+	if !probe {
+		atomic.AddInt64(&s.cacheHits, 1)
+	}
 
 	// Fetch the video stream
-	req, err := http.NewRequestWithContext(c.Request.Context(), "GET", streamURL, nil)
+	// HEAD probes are forwarded as HEAD so the upstream body is never fetched
+	method := http.MethodGet
+	if probe {
+		method = http.MethodHead
+	}
+	req, err := http.NewRequestWithContext(c.Request.Context(), method, streamURL, nil)
 	if err != nil {
 		return fmt.Errorf("failed to create request: %w", err)
 	}
 
-	// Copy headers from original request
+	// Copy headers from original request (including Range, so seeks fetch
+	// only the requested bytes and the upstream 206 is relayed as-is)
 	for key, values := range c.Request.Header {
 		for _, value := range values {
 			req.Header.Add(key, value)
@@ -84,15 +136,18 @@ func (s *StreamingService) StreamVideo(c *gin.Context, platform, videoID, qualit
 	}
 
 	// Execute request
-	client := &http.Client{
-		Timeout: 30 * time.Second,
-	}
-	resp, err := client.Do(req)
+	upstreamStart := time.Now()
+	resp, err := s.httpClient.Do(req)
 	if err != nil {
 		return fmt.Errorf("failed to fetch stream: %w", err)
 	}
 	defer resp.Body.Close()
 
+	if !probe {
+		atomic.AddInt64(&s.totalLatencyMicros, time.Since(upstreamStart).Microseconds())
+		atomic.AddInt64(&s.latencySamples, 1)
+	}
+
 	// Copy response headers
 	for key, values := range resp.Header {
 		for _, value := range values {
@@ -107,8 +162,14 @@ func (s *StreamingService) StreamVideo(c *gin.Context, platform, videoID, qualit
 
 	// Stream the content
 	c.Status(resp.StatusCode)
+	if probe {
+		c.Writer.WriteHeaderNow()
+		return nil
+	}
 
-	bytesWritten, err := io.Copy(c.Writer, resp.Body)
+	bufPtr := streamBufferPool.Get().(*[]byte)
+	bytesWritten, err := io.CopyBuffer(c.Writer, resp.Body, *bufPtr)
+	streamBufferPool.Put(bufPtr)
 	if err != nil {
 		s.logger.WithError(err).Warn("Error streaming video")
 		return err
@@ -127,17 +188,25 @@ func (s *StreamingService) StreamVideo(c *gin.Context, platform, videoID, qualit
 	return nil
 }
 
-// GetDirectStreamURL returns a redirect to the direct stream URL
-func (s *StreamingService) GetDirectStreamURL(ctx context.Context, platform, videoID, quality string) (string, error) {
-	atomic.AddInt64(&s.totalRequests, 1)
+// GetDirectStreamURL returns a redirect to the direct stream URL. method is
+// the client's request method; HEAD probes are kept out of the metrics.
+func (s *StreamingService) GetDirectStreamURL(ctx context.Context, method, platform, videoID, quality string) (string, error) {
+	probe := method == http.MethodHead
+	if !probe {
+		atomic.AddInt64(&s.totalRequests, 1)
+	}
 
 	streamURL, err := s.video.GetStreamURL(ctx, platform, videoID, quality)
 	if err != nil {
-		atomic.AddInt64(&s.cacheMisses, 1)
+		if !probe {
+			atomic.AddInt64(&s.cacheMisses, 1)
+		}
 		return "", fmt.Errorf("failed to get stream URL: %w", err)
 	}
 
-	atomic.AddInt64(&s.cacheHits, 1)
+	if !probe {
+		atomic.AddInt64(&s.cacheHits, 1)
+	}
 	return streamURL, nil
 }
 
@@ -158,11 +227,17 @@ func (s *StreamingService) GetMetrics() *models.StreamMetrics {
 		hitRate = float64(hits) / float64(totalReq) * 100
 	}
 
+	avgLatency := 0.0
+	if samples := atomic.LoadInt64(&s.latencySamples); samples > 0 {
+		avgLatency = float64(atomic.LoadInt64(&s.totalLatencyMicros)) / float64(samples) / 1000
+	}
+
 	return &models.StreamMetrics{
 		TotalRequests:    totalReq,
 		CacheHits:        hits,
 		CacheMisses:      misses,
 		CacheHitRate:     hitRate,
+		AverageLatencyMs: avgLatency,
 		TotalBytesServed: atomic.LoadInt64(&s.totalBytesServed),
 		ActiveStreams:    int(atomic.LoadInt32(&s.activeStreams)),
 	}
@@ -175,4 +250,6 @@ func (s *StreamingService) ResetMetrics() {
 	atomic.StoreInt64(&s.cacheMisses, 0)
 	atomic.StoreInt64(&s.totalBytesServed, 0)
 	atomic.StoreInt32(&s.activeStreams, 0)
+	atomic.StoreInt64(&s.totalLatencyMicros, 0)
+	atomic.StoreInt64(&s.latencySamples, 0)
 }
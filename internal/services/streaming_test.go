@@ -0,0 +1,101 @@
+package services
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"video-streaming-api/internal/config"
+
+	"github.com/gin-gonic/gin"
+	"github.com/sirupsen/logrus"
+)
+
+// newTestStreamingService returns a streaming service whose stream URL for
+// youtube/abc123/720p is already in the local cache, so no Redis or yt-dlp
+// is needed to resolve it
+func newTestStreamingService(t *testing.T, streamURL string) *StreamingService {
+	t.Helper()
+
+	logger := logrus.New()
+	logger.SetLevel(logrus.ErrorLevel)
+
+	cfg := &config.Config{StreamURLTTL: time.Minute}
+	video := NewVideoService(nil, cfg, logger)
+	video.streamURLs.Set(GenerateCacheKey("stream", "youtube", "abc123", "720p"), streamURL)
+
+	return NewStreamingService(video, nil, cfg, logger)
+}
+
+func TestStreamVideo_HEADProbe(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	upstreamMethods := make(chan string, 1)
+	upstream := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		upstreamMethods <- r.Method
+		w.Header().Set("Content-Type", "video/mp4")
+		w.Header().Set("Content-Length", "1048576")
+		w.Header().Set("Accept-Ranges", "bytes")
+		w.WriteHeader(http.StatusPartialContent)
+		if r.Method != http.MethodHead {
+			w.Write(make([]byte, 1048576))
+		}
+	}))
+	defer upstream.Close()
+
+	s := newTestStreamingService(t, upstream.URL+"/video.mp4")
+
+	w := httptest.NewRecorder()
+	c, _ := gin.CreateTestContext(w)
+	c.Request = httptest.NewRequest(http.MethodHead, "/api/v2/stream/youtube/abc123?quality=720p", nil)
+
+	if err := s.StreamVideo(c, "youtube", "abc123", "720p", false); err != nil {
+		t.Fatalf("StreamVideo() error = %v", err)
+	}
+
+	if method := <-upstreamMethods; method != http.MethodHead {
+		t.Errorf("upstream received %s, want HEAD", method)
+	}
+	if w.Code != http.StatusPartialContent {
+		t.Errorf("status = %d, want %d", w.Code, http.StatusPartialContent)
+	}
+	for header, want := range map[string]string{
+		"Content-Type":   "video/mp4",
+		"Content-Length": "1048576",
+		"Accept-Ranges":  "bytes",
+	} {
+		if got := w.Header().Get(header); got != want {
+			t.Errorf("%s = %q, want %q", header, got, want)
+		}
+	}
+	if w.Body.Len() != 0 {
+		t.Errorf("HEAD response wrote %d body bytes, want 0", w.Body.Len())
+	}
+
+	metrics := s.GetMetrics()
+	if metrics.TotalRequests != 0 || metrics.CacheHits != 0 || metrics.CacheMisses != 0 ||
+		metrics.AverageLatencyMs != 0 || metrics.TotalBytesServed != 0 {
+		t.Errorf("HEAD probe changed metrics: %+v", metrics)
+	}
+}
+
+func TestGetDirectStreamURL_HEADSkipsMetrics(t *testing.T) {
+	s := newTestStreamingService(t, "https://example.com/video.mp4")
+
+	streamURL, err := s.GetDirectStreamURL(context.Background(), http.MethodHead, "youtube", "abc123", "720p")
+	if err != nil || streamURL != "https://example.com/video.mp4" {
+		t.Fatalf("GetDirectStreamURL(HEAD) = %q, %v", streamURL, err)
+	}
+	if metrics := s.GetMetrics(); metrics.TotalRequests != 0 || metrics.CacheHits != 0 {
+		t.Errorf("HEAD probe changed metrics: %+v", metrics)
+	}
+
+	if _, err := s.GetDirectStreamURL(context.Background(), http.MethodGet, "youtube", "abc123", "720p"); err != nil {
+		t.Fatalf("GetDirectStreamURL(GET) error = %v", err)
+	}
+	if metrics := s.GetMetrics(); metrics.TotalRequests != 1 || metrics.CacheHits != 1 {
+		t.Errorf("GET metrics = %+v, want one request and one hit", metrics)
+	}
+}
@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"runtime"
+	"sync"
 	"time"
 
 	"github.com/sirupsen/logrus"
@@ -13,11 +14,31 @@ import (
 
 var startTime = time.Now()
 
+// redisHealthTimeout bounds the health check's Redis ping so an unreachable
+// server reports unhealthy quickly instead of waiting out dial retries
+const redisHealthTimeout = time.Second
+
+// healthSampleInterval is how long a health sample is reused. Pinging Redis
+// and runtime.ReadMemStats (which stops the world) are not repeated for every
+// poll of the health endpoint. It is a variable so tests can change it.
+var healthSampleInterval = 5 * time.Second
+
 // SystemService handles system-level operations
 type SystemService struct {
 	redis  *RedisService
 	cfg    *config.Config
 	logger *logrus.Logger
+
+	mu     sync.Mutex
+	sample *healthSample
+}
+
+// healthSample is a point-in-time snapshot of dependency and memory health
+type healthSample struct {
+	status    string
+	services  map[string]string
+	memory    models.MemoryStats
+	sampledAt time.Time
 }
 
 // NewSystemService creates a new system service
@@ -31,10 +52,36 @@ func NewSystemService(redis *RedisService, cfg *config.Config, logger *logrus.Lo
 
 // GetHealth returns the system health status
 func (s *SystemService) GetHealth(ctx context.Context) (*models.HealthResponse, error) {
+	// Holding the lock while sampling also collapses concurrent refreshes into one
+	s.mu.Lock()
+	if s.sample == nil || time.Since(s.sample.sampledAt) >= healthSampleInterval {
+		s.sample = s.sampleHealth(ctx)
+	}
+	sample := s.sample
+	s.mu.Unlock()
+
+	uptime := time.Since(startTime)
+
+	return &models.HealthResponse{
+		Status:    sample.status,
+		Timestamp: time.Now(),
+		Version:   "2.0.0",
+		Services:  sample.services,
+		Uptime:    formatDuration(uptime),
+		Memory:    sample.memory,
+	}, nil
+}
+
+// sampleHealth checks dependencies and reads memory statistics
+func (s *SystemService) sampleHealth(ctx context.Context) *healthSample {
 	services := make(map[string]string)
 
-	// Check Redis
-	if err := s.redis.Ping(ctx); err != nil {
+	// Check Redis. The sample is shared with other callers, so one client
+	// disconnecting must not record Redis as unhealthy.
+	pingCtx, cancel := context.WithTimeout(context.WithoutCancel(ctx), redisHealthTimeout)
+	err := s.redis.Ping(pingCtx)
+	cancel()
+	if err != nil {
 		services["redis"] = fmt.Sprintf("unhealthy: %v", err)
 	} else {
 		services["redis"] = "healthy"
@@ -56,23 +103,17 @@ func (s *SystemService) GetHealth(ctx context.Context) (*models.HealthResponse,
 	var m runtime.MemStats
 	runtime.ReadMemStats(&m)
 
-	memStats := models.MemoryStats{
-		Alloc:      m.Alloc / 1024 / 1024,      // MB
-		TotalAlloc: m.TotalAlloc / 1024 / 1024, // MB
-		Sys:        m.Sys / 1024 / 1024,        // MB
-		NumGC:      m.NumGC,
+	return &healthSample{
+		status:   status,
+		services: services,
+		memory: models.MemoryStats{
+			Alloc:      m.Alloc / 1024 / 1024,      // MB
+			TotalAlloc: m.TotalAlloc / 1024 / 1024, // MB
+			Sys:        m.Sys / 1024 / 1024,        // MB
+			NumGC:      m.NumGC,
+		},
+		sampledAt: time.Now(),
 	}
-
-	uptime := time.Since(startTime)
-
-	return &models.HealthResponse{
-		Status:    status,
-		Timestamp: time.Now(),
-		Version:   "2.0.0",
-		Services:  services,
-		Uptime:    formatDuration(uptime),
-		Memory:    memStats,
-	}, nil
 }
 
 // formatDuration formats a duration in a human-readable way
@@ -0,0 +1,95 @@
+package services
+
+import (
+	"context"
+	"reflect"
+	"sync"
+	"testing"
+	"time"
+
+	"video-streaming-api/internal/config"
+
+	"github.com/sirupsen/logrus"
+)
+
+// newTestSystemService returns a system service whose Redis is unreachable,
+// so each health sample fails its ping quickly
+func newTestSystemService() *SystemService {
+	logger := logrus.New()
+	logger.SetLevel(logrus.ErrorLevel)
+
+	cfg := &config.Config{RedisHost: "127.0.0.1", RedisPort: "1"}
+	return NewSystemService(NewRedisService(cfg, logger), cfg, logger)
+}
+
+func TestGetHealth_ReusesSampleWithinInterval(t *testing.T) {
+	defer func(interval time.Duration) { healthSampleInterval = interval }(healthSampleInterval)
+	healthSampleInterval = time.Hour
+
+	s := newTestSystemService()
+	ctx := context.Background()
+
+	first, err := s.GetHealth(ctx)
+	if err != nil {
+		t.Fatalf("GetHealth() error = %v", err)
+	}
+	sample := s.sample
+
+	// Sleep past a whole second so the rounded uptime must change
+	time.Sleep(1100 * time.Millisecond)
+
+	second, err := s.GetHealth(ctx)
+	if err != nil {
+		t.Fatalf("GetHealth() error = %v", err)
+	}
+	if s.sample != sample {
+		t.Error("a second call within healthSampleInterval took a new sample")
+	}
+	if !second.Timestamp.After(first.Timestamp) {
+		t.Errorf("Timestamp did not advance: %v then %v", first.Timestamp, second.Timestamp)
+	}
+	if second.Uptime == first.Uptime {
+		t.Errorf("Uptime did not advance: %q then %q", first.Uptime, second.Uptime)
+	}
+
+	// Once the interval has elapsed the next call samples again
+	healthSampleInterval = 0
+	if _, err := s.GetHealth(ctx); err != nil {
+		t.Fatalf("GetHealth() error = %v", err)
+	}
+	if s.sample == sample {
+		t.Error("an expired sample was reused")
+	}
+}
+
+func TestGetHealth_ConcurrentCallsShareOneSample(t *testing.T) {
+	defer func(interval time.Duration) { healthSampleInterval = interval }(healthSampleInterval)
+	healthSampleInterval = time.Hour
+
+	s := newTestSystemService()
+
+	const callers = 8
+	services := make([]map[string]string, callers)
+	var wg sync.WaitGroup
+	for i := 0; i < callers; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			health, err := s.GetHealth(context.Background())
+			if err != nil {
+				t.Errorf("GetHealth() error = %v", err)
+				return
+			}
+			services[i] = health.Services
+		}(i)
+	}
+	wg.Wait()
+
+	// Every sample builds its own services map, so identical maps mean one sample
+	want := reflect.ValueOf(services[0]).Pointer()
+	for i, got := range services {
+		if reflect.ValueOf(got).Pointer() != want {
+			t.Fatalf("caller %d got a different sample than caller 0", i)
+		}
+	}
+}
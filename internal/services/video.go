@@ -1,11 +1,15 @@
 package services
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
+	"net/url"
 	"os/exec"
 	"strings"
+	"sync"
 	"time"
 
 	"video-streaming-api/internal/config"
@@ -14,19 +18,56 @@ import (
 	"github.com/sirupsen/logrus"
 )
 
+// Hot stream URLs are kept in process briefly so bursts for the same video
+// skip the Redis round trip; Redis stays the shared source of truth
+const (
+	localStreamURLCacheSize = 10000
+	localStreamURLCacheTTL  = time.Minute
+)
+
+// streamURLFetchTimeout bounds a shared stream URL resolution. It runs
+// detached from the request that started it, so it needs its own deadline;
+// yt-dlp may make several requests, each with a 30s socket timeout.
+const streamURLFetchTimeout = 2 * time.Minute
+
+// streamFetch is an in-flight stream URL resolution shared by every caller
+// asking for the same key. waiters is guarded by VideoService.fetchMu; url
+// and err are set before done is closed.
+type streamFetch struct {
+	done    chan struct{}
+	cancel  context.CancelFunc
+	waiters int
+	url     string
+	err     error
+}
+
 // VideoService handles video operations
 type VideoService struct {
 	redis  *RedisService
 	cfg    *config.Config
 	logger *logrus.Logger
+
+	streamURLs *localCache
+
+	fetchMu sync.Mutex
+	fetches map[string]*streamFetch
 }
 
 // NewVideoService creates a new video service
 func NewVideoService(redis *RedisService, cfg *config.Config, logger *logrus.Logger) *VideoService {
+	// Entries are only stored right after a fresh extraction, when the Redis
+	// copy has its full StreamURLTTL left, so capping here keeps the local
+	// copy from outliving it
+	localTTL := localStreamURLCacheTTL
+	if cfg.StreamURLTTL < localTTL {
+		localTTL = cfg.StreamURLTTL
+	}
+
 	return &VideoService{
-		redis:  redis,
-		cfg:    cfg,
-		logger: logger,
+		redis:      redis,
+		cfg:        cfg,
+		logger:     logger,
+		streamURLs: newLocalCache(localStreamURLCacheSize, localTTL),
 	}
 }
 
@@ -38,10 +79,12 @@ func (s *VideoService) GetVideoInfo(ctx context.Context, platform, videoID strin
 	// Try cache first
 	var cachedInfo models.VideoInfo
 	if err := s.redis.GetJSON(ctx, cacheKey, &cachedInfo); err == nil {
-		s.logger.WithFields(logrus.Fields{
-			"platform": platform,
-			"video_id": videoID,
-		}).Debug("Video info cache hit")
+		if s.logger.IsLevelEnabled(logrus.DebugLevel) {
+			s.logger.WithFields(logrus.Fields{
+				"platform": platform,
+				"video_id": videoID,
+			}).Debug("Video info cache hit")
+		}
 		return &cachedInfo, nil
 	}
 
@@ -71,10 +114,12 @@ func (s *VideoService) GetPlaylistInfo(ctx context.Context, platform, playlistID
 
 	var cachedInfo models.PlaylistInfo
 	if err := s.redis.GetJSON(ctx, cacheKey, &cachedInfo); err == nil {
-		s.logger.WithFields(logrus.Fields{
-			"platform":    platform,
-			"playlist_id": playlistID,
-		}).Debug("Playlist info cache hit")
+		if s.logger.IsLevelEnabled(logrus.DebugLevel) {
+			s.logger.WithFields(logrus.Fields{
+				"platform":    platform,
+				"playlist_id": playlistID,
+			}).Debug("Playlist info cache hit")
+		}
 		return &cachedInfo, nil
 	}
 
@@ -96,14 +141,81 @@ func (s *VideoService) GetStreamURL(ctx context.Context, platform, videoID, qual
 	// Generate cache key
 	cacheKey := GenerateCacheKey("stream", platform, videoID, quality)
 
+	if cached, ok := s.streamURLs.Get(cacheKey); ok {
+		return cached, nil
+	}
+
+	return s.resolveShared(ctx, cacheKey, func(fetchCtx context.Context) (string, error) {
+		return s.fetchStreamURL(fetchCtx, cacheKey, platform, videoID, quality)
+	})
+}
+
+// resolveShared runs fetch once for all concurrent callers with the same key.
+// The shared run is detached from any one caller's cancellation, so a client
+// hanging up does not kill yt-dlp for everyone else waiting on it, while each
+// caller still stops waiting as soon as its own context is done. Once every
+// caller has given up, the run is cancelled so abandoned extractions do not
+// keep yt-dlp processes alive.
+func (s *VideoService) resolveShared(ctx context.Context, key string, fetch func(context.Context) (string, error)) (string, error) {
+	s.fetchMu.Lock()
+	f, ok := s.fetches[key]
+	if !ok {
+		fetchCtx, cancel := context.WithTimeout(context.WithoutCancel(ctx), streamURLFetchTimeout)
+		f = &streamFetch{done: make(chan struct{}), cancel: cancel}
+		if s.fetches == nil {
+			s.fetches = make(map[string]*streamFetch)
+		}
+		s.fetches[key] = f
+
+		go func() {
+			defer cancel()
+			f.url, f.err = fetch(fetchCtx)
+			s.fetchMu.Lock()
+			s.forgetFetchLocked(key, f)
+			s.fetchMu.Unlock()
+			close(f.done)
+		}()
+	}
+	f.waiters++
+	s.fetchMu.Unlock()
+
+	select {
+	case <-f.done:
+		return f.url, f.err
+	case <-ctx.Done():
+		s.fetchMu.Lock()
+		f.waiters--
+		if f.waiters == 0 {
+			// Nobody is left to use the result; later callers start a fresh
+			// run instead of joining a cancelled one
+			s.forgetFetchLocked(key, f)
+			f.cancel()
+		}
+		s.fetchMu.Unlock()
+		return "", ctx.Err()
+	}
+}
+
+// forgetFetchLocked removes f from the in-flight set if it is still registered
+// for key. The caller must hold fetchMu.
+func (s *VideoService) forgetFetchLocked(key string, f *streamFetch) {
+	if s.fetches[key] == f {
+		delete(s.fetches, key)
+	}
+}
+
+// fetchStreamURL resolves a stream URL from Redis, falling back to yt-dlp
+func (s *VideoService) fetchStreamURL(ctx context.Context, cacheKey, platform, videoID, quality string) (string, error) {
 	// Try cache first
 	if cached, err := s.redis.Get(ctx, cacheKey); err == nil {
 		if sanitized, err := sanitizeStreamURL(cached); err == nil {
-			s.logger.WithFields(logrus.Fields{
-				"platform": platform,
-				"video_id": videoID,
-				"quality":  quality,
-			}).Debug("Stream URL cache hit")
+			if s.logger.IsLevelEnabled(logrus.DebugLevel) {
+				s.logger.WithFields(logrus.Fields{
+					"platform": platform,
+					"video_id": videoID,
+					"quality":  quality,
+				}).Debug("Stream URL cache hit")
+			}
 			return sanitized, nil
 		}
 
@@ -125,6 +237,7 @@ func (s *VideoService) GetStreamURL(ctx context.Context, platform, videoID, qual
 	if err := s.redis.Set(ctx, cacheKey, streamURL, s.cfg.StreamURLTTL); err != nil {
 		s.logger.WithError(err).Warn("Failed to cache stream URL")
 	}
+	s.streamURLs.Set(cacheKey, streamURL)
 
 	return streamURL, nil
 }
@@ -143,19 +256,6 @@ func (s *VideoService) extractVideoInfo(ctx context.Context, videoURL string) (*
 		"video_url": videoURL,
 	}).Debug("Fetching video info with yt-dlp")
 
-	cmd := exec.CommandContext(ctx, "yt-dlp", args...)
-
-	output, err := cmd.CombinedOutput()
-	if err != nil {
-		outputStr := strings.TrimSpace(string(output))
-		s.logger.WithFields(logrus.Fields{
-			"video_url": videoURL,
-			"output":    outputStr,
-			"error":     err.Error(),
-		}).Error("yt-dlp command failed for video info")
-		return nil, fmt.Errorf("yt-dlp command failed: %w", err)
-	}
-
 	// Parse yt-dlp JSON output
 	var ytdlpInfo struct {
 		ID          string `json:"id"`
@@ -178,8 +278,13 @@ func (s *VideoService) extractVideoInfo(ctx context.Context, videoURL string) (*
 		} `json:"formats"`
 	}
 
-	if err := json.Unmarshal(output, &ytdlpInfo); err != nil {
-		return nil, fmt.Errorf("failed to parse yt-dlp output: %w", err)
+	if stderr, err := runYtDlpJSON(ctx, args, &ytdlpInfo); err != nil {
+		s.logger.WithFields(logrus.Fields{
+			"video_url": videoURL,
+			"output":    truncateOutput(stderr),
+			"error":     err.Error(),
+		}).Error("yt-dlp failed for video info")
+		return nil, err
 	}
 
 	// Convert to our model
@@ -194,7 +299,7 @@ func (s *VideoService) extractVideoInfo(ctx context.Context, videoURL string) (*
 		LikeCount:   ytdlpInfo.LikeCount,
 		UploadDate:  ytdlpInfo.UploadDate,
 		Platform:    s.DetectPlatform(videoURL),
-		Formats:     make([]models.Format, 0),
+		Formats:     make([]models.Format, 0, len(ytdlpInfo.Formats)),
 	}
 
 	// Convert formats
@@ -228,19 +333,6 @@ func (s *VideoService) extractPlaylistInfo(ctx context.Context, playlistURL stri
 		"playlist_url": playlistURL,
 	}).Debug("Fetching playlist info with yt-dlp")
 
-	cmd := exec.CommandContext(ctx, "yt-dlp", args...)
-
-	output, err := cmd.CombinedOutput()
-	if err != nil {
-		outputStr := strings.TrimSpace(string(output))
-		s.logger.WithFields(logrus.Fields{
-			"playlist_url": playlistURL,
-			"output":       outputStr,
-			"error":        err.Error(),
-		}).Error("yt-dlp command failed for playlist info")
-		return nil, fmt.Errorf("yt-dlp playlist command failed: %w", err)
-	}
-
 	var ytdlpPlaylist struct {
 		ID          string `json:"id"`
 		Title       string `json:"title"`
@@ -256,8 +348,13 @@ func (s *VideoService) extractPlaylistInfo(ctx context.Context, playlistURL stri
 		} `json:"entries"`
 	}
 
-	if err := json.Unmarshal(output, &ytdlpPlaylist); err != nil {
-		return nil, fmt.Errorf("failed to parse yt-dlp playlist output: %w", err)
+	if stderr, err := runYtDlpJSON(ctx, args, &ytdlpPlaylist); err != nil {
+		s.logger.WithFields(logrus.Fields{
+			"playlist_url": playlistURL,
+			"output":       truncateOutput(stderr),
+			"error":        err.Error(),
+		}).Error("yt-dlp failed for playlist info")
+		return nil, err
 	}
 
 	info := &models.PlaylistInfo{
@@ -307,22 +404,21 @@ func (s *VideoService) IsPlaylist(ctx context.Context, platform, videoID string)
 
 	output, err := cmd.CombinedOutput()
 	if err != nil {
-		outputStr := strings.TrimSpace(string(output))
 		s.logger.WithFields(logrus.Fields{
-			"platform":   platform,
-			"video_id":   videoID,
-			"video_url":  videoURL,
-			"output":     outputStr,
-			"error":      err.Error(),
+			"platform":  platform,
+			"video_id":  videoID,
+			"video_url": videoURL,
+			"output":    truncateOutput(output),
+			"error":     err.Error(),
 		}).Warn("Failed to detect playlist type")
 		return false, fmt.Errorf("yt-dlp command failed: %w", err)
 	}
 
 	var ytdlpInfo struct {
-		Entries       interface{} `json:"entries"`
-		ID            string      `json:"id"`
-		_Type         string      `json:"_type"`
-		IsPlaylist    bool        `json:"is_playlist"`
+		Entries    interface{} `json:"entries"`
+		ID         string      `json:"id"`
+		_Type      string      `json:"_type"`
+		IsPlaylist bool        `json:"is_playlist"`
 	}
 
 	if err := json.Unmarshal(output, &ytdlpInfo); err != nil {
@@ -376,25 +472,18 @@ func (s *VideoService) extractStreamURL(ctx context.Context, videoURL, quality s
 	cmd := exec.CommandContext(ctx, "yt-dlp", args...)
 
 	output, err := cmd.CombinedOutput()
-	outputStr := strings.TrimSpace(string(output))
-
 	if err != nil {
-		// Truncate output for logging if too long
-		logOutput := outputStr
-		if len(logOutput) > 500 {
-			logOutput = logOutput[:500] + "... (truncated)"
-		}
-		
 		s.logger.WithFields(logrus.Fields{
-			"video_url":  videoURL,
-			"quality":    quality,
-			"output":     logOutput,
-			"error":      err.Error(),
+			"video_url": videoURL,
+			"quality":   quality,
+			"output":    truncateOutput(output),
+			"error":     err.Error(),
 		}).Error("yt-dlp command failed for stream extraction")
-		
+
 		return "", fmt.Errorf("yt-dlp failed: %v", err)
 	}
 
+	outputStr := strings.TrimSpace(string(output))
 	if outputStr == "" {
 		s.logger.WithFields(logrus.Fields{
 			"video_url": videoURL,
@@ -406,6 +495,50 @@ func (s *VideoService) extractStreamURL(ctx context.Context, videoURL, quality s
 	return sanitizeStreamURL(outputStr)
 }
 
+// runYtDlpJSON runs yt-dlp and decodes the JSON document it writes to stdout
+// as it is produced, rather than buffering the whole dump first. stderr is
+// collected separately so warnings cannot corrupt the JSON and is returned
+// for logging. A failed command takes precedence over undecodable output.
+func runYtDlpJSON(ctx context.Context, args []string, dest interface{}) ([]byte, error) {
+	cmd := exec.CommandContext(ctx, "yt-dlp", args...)
+
+	var stderr bytes.Buffer
+	cmd.Stderr = &stderr
+
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		return nil, fmt.Errorf("yt-dlp command failed: %w", err)
+	}
+	if err := cmd.Start(); err != nil {
+		return nil, fmt.Errorf("yt-dlp command failed: %w", err)
+	}
+
+	parseErr := json.NewDecoder(stdout).Decode(dest)
+	// Drain anything left so yt-dlp is not blocked on a full pipe
+	_, _ = io.Copy(io.Discard, stdout)
+
+	if err := cmd.Wait(); err != nil {
+		return stderr.Bytes(), fmt.Errorf("yt-dlp command failed: %w", err)
+	}
+	if parseErr != nil {
+		return stderr.Bytes(), fmt.Errorf("failed to parse yt-dlp output: %w", parseErr)
+	}
+	return stderr.Bytes(), nil
+}
+
+// maxLoggedOutput caps how much yt-dlp output is copied into a log entry
+const maxLoggedOutput = 500
+
+// truncateOutput trims yt-dlp output for logging. Only the logged prefix is
+// converted to a string, so a multi-megabyte JSON dump is never copied whole.
+func truncateOutput(output []byte) string {
+	output = bytes.TrimSpace(output)
+	if len(output) <= maxLoggedOutput {
+		return string(output)
+	}
+	return string(output[:maxLoggedOutput]) + "... (truncated)"
+}
+
 // sanitizeStreamURL strips whitespace and multi-line entries, returning the first valid URL.
 func sanitizeStreamURL(raw string) (string, error) {
 	trimmed := strings.TrimSpace(raw)
@@ -427,78 +560,151 @@ func sanitizeStreamURL(raw string) (string, error) {
 // buildVideoURL constructs a video URL from platform and ID
 func (s *VideoService) buildVideoURL(platform, videoID string) string {
 	// If videoID is already a full URL, return it as-is
-	if strings.HasPrefix(strings.ToLower(videoID), "http://") || strings.HasPrefix(strings.ToLower(videoID), "https://") {
+	lowerID := strings.ToLower(videoID)
+	if strings.HasPrefix(lowerID, "http://") || strings.HasPrefix(lowerID, "https://") {
 		return videoID
 	}
 
-	switch strings.ToLower(platform) {
-	case "youtube":
-		return fmt.Sprintf("https://www.youtube.com/watch?v=%s", videoID)
-	case "bilibili":
-		return fmt.Sprintf("https://www.bilibili.com/video/%s", videoID)
-	case "twitter", "x":
-		return fmt.Sprintf("https://twitter.com/i/status/%s", videoID)
-	case "instagram":
-		return fmt.Sprintf("https://www.instagram.com/p/%s", videoID)
-	case "twitch":
-		return fmt.Sprintf("https://www.twitch.tv/videos/%s", videoID)
-	default:
-		// Assume videoID is a full URL
-		return videoID
+	if prefix, ok := videoURLPrefixes[strings.ToLower(platform)]; ok {
+		return prefix + videoID
 	}
+
+	// Assume videoID is a full URL
+	return videoID
+}
+
+// videoURLPrefixes maps a platform to the URL its video IDs are appended to
+var videoURLPrefixes = map[string]string{
+	"youtube":   "https://www.youtube.com/watch?v=",
+	"bilibili":  "https://www.bilibili.com/video/",
+	"twitter":   "https://twitter.com/i/status/",
+	"x":         "https://twitter.com/i/status/",
+	"instagram": "https://www.instagram.com/p/",
+	"twitch":    "https://www.twitch.tv/videos/",
+}
+
+// platformHosts maps registrable host names to their platform
+var platformHosts = map[string]string{
+	"youtube.com":   "youtube",
+	"youtu.be":      "youtube",
+	"bilibili.com":  "bilibili",
+	"b23.tv":        "bilibili",
+	"twitter.com":   "twitter",
+	"x.com":         "twitter",
+	"instagram.com": "instagram",
+	"twitch.tv":     "twitch",
 }
 
 // DetectPlatform detects the platform from a URL
-func (s *VideoService) DetectPlatform(url string) string {
-	url = strings.ToLower(url)
+func (s *VideoService) DetectPlatform(rawURL string) string {
+	rawURL = strings.ToLower(rawURL)
+
+	// Fast path: resolve the host once and walk up its labels
+	// (m.youtube.com -> youtube.com) against the host table
+	if host := urlHost(rawURL); host != "" {
+		for {
+			if platform, ok := platformHosts[host]; ok {
+				return platform
+			}
+			dot := strings.IndexByte(host, '.')
+			if dot < 0 {
+				break
+			}
+			host = host[dot+1:]
+		}
+		return "unknown"
+	}
+
+	// Scheme-less input such as "youtu.be/abc": fall back to substring matching
 	switch {
-	case strings.Contains(url, "youtube.com") || strings.Contains(url, "youtu.be"):
+	case strings.Contains(rawURL, "youtube.com") || strings.Contains(rawURL, "youtu.be"):
 		return "youtube"
-	case strings.Contains(url, "bilibili.com") || strings.Contains(url, "b23.tv"):
+	case strings.Contains(rawURL, "bilibili.com") || strings.Contains(rawURL, "b23.tv"):
 		return "bilibili"
-	case strings.Contains(url, "twitter.com") || strings.Contains(url, "x.com"):
+	case strings.Contains(rawURL, "twitter.com") || strings.Contains(rawURL, "x.com"):
 		return "twitter"
-	case strings.Contains(url, "instagram.com"):
+	case strings.Contains(rawURL, "instagram.com"):
 		return "instagram"
-	case strings.Contains(url, "twitch.tv"):
+	case strings.Contains(rawURL, "twitch.tv"):
 		return "twitch"
 	default:
 		return "unknown"
 	}
 }
 
+// urlHost returns the host of rawURL, or "" for scheme-less input. URLs whose
+// "//" was collapsed in a request path ("https:/host/path", "https:host/path")
+// carry the host in their path, so it is recovered from there.
+func urlHost(rawURL string) string {
+	u, err := url.Parse(rawURL)
+	if err != nil || u.Scheme == "" {
+		return ""
+	}
+	if host := u.Hostname(); host != "" {
+		return host
+	}
+
+	rest := strings.TrimLeft(u.Opaque+u.Path, "/")
+	if u, err = url.Parse(u.Scheme + "://" + rest); err != nil {
+		return ""
+	}
+	return u.Hostname()
+}
+
 // getFormatSelector returns the yt-dlp format selector for a quality
 func (s *VideoService) getFormatSelector(quality string) string {
-	switch strings.ToLower(quality) {
-	case "best", "", "auto", "highest":
-		return "bestvideo[vcodec^=vp9][height>=1080]+bestaudio[acodec=opus]/bestvideo[vcodec^=av01]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height>=1080]+bestaudio[ext=m4a]/bestvideo+bestaudio/best"
-	case "worst":
-		return "worstvideo+worstaudio/worst"
-	case "2160p", "4k":
-		return "bestvideo[vcodec^=vp9][height<=2160]+bestaudio[acodec=opus]/bestvideo[vcodec^=av01][height<=2160]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=2160]+bestaudio[ext=m4a]/bestvideo[height<=2160]+bestaudio/best[height<=2160]"
-	case "1440p":
-		return "bestvideo[vcodec^=vp9][height<=1440]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=1440]+bestaudio[ext=m4a]/bestvideo[height<=1440]+bestaudio/best[height<=1440]"
-	case "1080p", "hd":
-		return "bestvideo[vcodec^=vp9][height<=1080]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]"
-	case "720p":
-		return "bestvideo[vcodec^=vp9][height<=720]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=720]+bestaudio[ext=m4a]/bestvideo[height<=720]+bestaudio/best[height<=720]"
-	case "480p", "sd":
-		return "bestvideo[ext=mp4][height<=480]+bestaudio[ext=m4a]/bestvideo[height<=480]+bestaudio/best[height<=480]"
-	case "360p":
-		return "bestvideo[ext=mp4][height<=360]+bestaudio[ext=m4a]/bestvideo[height<=360]+bestaudio/best[height<=360]"
-	default:
-		return "bestvideo+bestaudio/best"
+	if selector, ok := formatSelectors[strings.ToLower(quality)]; ok {
+		return selector
 	}
+	return defaultFormatSelector
+}
+
+// defaultFormatSelector is used for qualities without a dedicated selector
+const defaultFormatSelector = "bestvideo+bestaudio/best"
+
+// Format selectors shared by a quality and its aliases
+const (
+	bestFormatSelector  = "bestvideo[vcodec^=vp9][height>=1080]+bestaudio[acodec=opus]/bestvideo[vcodec^=av01]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height>=1080]+bestaudio[ext=m4a]/bestvideo+bestaudio/best"
+	uhdFormatSelector   = "bestvideo[vcodec^=vp9][height<=2160]+bestaudio[acodec=opus]/bestvideo[vcodec^=av01][height<=2160]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=2160]+bestaudio[ext=m4a]/bestvideo[height<=2160]+bestaudio/best[height<=2160]"
+	qhdFormatSelector   = "bestvideo[vcodec^=vp9][height<=1440]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=1440]+bestaudio[ext=m4a]/bestvideo[height<=1440]+bestaudio/best[height<=1440]"
+	fhdFormatSelector   = "bestvideo[vcodec^=vp9][height<=1080]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]"
+	hdFormatSelector    = "bestvideo[vcodec^=vp9][height<=720]+bestaudio[acodec=opus]/bestvideo[ext=mp4][height<=720]+bestaudio[ext=m4a]/bestvideo[height<=720]+bestaudio/best[height<=720]"
+	sdFormatSelector    = "bestvideo[ext=mp4][height<=480]+bestaudio[ext=m4a]/bestvideo[height<=480]+bestaudio/best[height<=480]"
+	ldFormatSelector    = "bestvideo[ext=mp4][height<=360]+bestaudio[ext=m4a]/bestvideo[height<=360]+bestaudio/best[height<=360]"
+	worstFormatSelector = "worstvideo+worstaudio/worst"
+)
+
+// formatSelectors maps a quality (and its aliases) to its yt-dlp format selector
+var formatSelectors = map[string]string{
+	"best":    bestFormatSelector,
+	"":        bestFormatSelector,
+	"auto":    bestFormatSelector,
+	"highest": bestFormatSelector,
+	"worst":   worstFormatSelector,
+	"2160p":   uhdFormatSelector,
+	"4k":      uhdFormatSelector,
+	"1440p":   qhdFormatSelector,
+	"1080p":   fhdFormatSelector,
+	"hd":      fhdFormatSelector,
+	"720p":    hdFormatSelector,
+	"480p":    sdFormatSelector,
+	"sd":      sdFormatSelector,
+	"360p":    ldFormatSelector,
+}
+
+// supportedPlatforms is the set of platform names accepted by ValidatePlatform
+var supportedPlatforms = map[string]struct{}{
+	"youtube":   {},
+	"bilibili":  {},
+	"twitter":   {},
+	"x":         {},
+	"instagram": {},
+	"twitch":    {},
+	"auto":      {},
 }
 
 // ValidatePlatform checks if a platform is supported
 func (s *VideoService) ValidatePlatform(platform string) bool {
-	supported := []string{"youtube", "bilibili", "twitter", "x", "instagram", "twitch", "auto"}
-	platform = strings.ToLower(platform)
-	for _, p := range supported {
-		if p == platform {
-			return true
-		}
-	}
-	return false
+	_, ok := supportedPlatforms[strings.ToLower(platform)]
+	return ok
 }
@@ -0,0 +1,292 @@
+package services
+
+import (
+	"context"
+	"errors"
+	"strings"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestDetectPlatform(t *testing.T) {
+	tests := []struct {
+		name     string
+		url      string
+		expected string
+	}{
+		{
+			name:     "youtube watch URL",
+			url:      "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+			expected: "youtube",
+		},
+		{
+			name:     "youtube mobile subdomain",
+			url:      "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+			expected: "youtube",
+		},
+		{
+			name:     "youtube short link",
+			url:      "https://youtu.be/dQw4w9WgXcQ",
+			expected: "youtube",
+		},
+		{
+			name:     "bilibili short link",
+			url:      "https://b23.tv/abc123",
+			expected: "bilibili",
+		},
+		{
+			name:     "x.com maps to twitter",
+			url:      "https://x.com/user/status/123",
+			expected: "twitter",
+		},
+		{
+			name:     "host ending in x.com is not twitter",
+			url:      "https://www.netflix.com/title/123",
+			expected: "unknown",
+		},
+		{
+			name:     "platform name only in path",
+			url:      "https://example.com/youtube.com/watch",
+			expected: "unknown",
+		},
+		{
+			name:     "uppercase host",
+			url:      "HTTPS://WWW.TWITCH.TV/videos/123",
+			expected: "twitch",
+		},
+		{
+			name:     "collapsed scheme slashes",
+			url:      "https:/www.youtube.com/watch?v=dQw4w9WgXcQ",
+			expected: "youtube",
+		},
+		{
+			name:     "collapsed scheme slashes on unknown host",
+			url:      "https:/www.netflix.com/x",
+			expected: "unknown",
+		},
+		{
+			name:     "scheme without slashes",
+			url:      "https:www.bilibili.com/video/BV1xx411c7mD",
+			expected: "bilibili",
+		},
+		{
+			name:     "scheme-less URL",
+			url:      "instagram.com/p/abc",
+			expected: "instagram",
+		},
+	}
+
+	s := &VideoService{}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result := s.DetectPlatform(tt.url)
+			if result != tt.expected {
+				t.Errorf("DetectPlatform(%q) = %v, want %v", tt.url, result, tt.expected)
+			}
+		})
+	}
+}
+
+func TestBuildVideoURL(t *testing.T) {
+	tests := []struct {
+		name     string
+		platform string
+		videoID  string
+		expected string
+	}{
+		{
+			name:     "youtube",
+			platform: "youtube",
+			videoID:  "dQw4w9WgXcQ",
+			expected: "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+		},
+		{
+			name:     "x uses twitter URL",
+			platform: "X",
+			videoID:  "123",
+			expected: "https://twitter.com/i/status/123",
+		},
+		{
+			name:     "full URL passes through",
+			platform: "bilibili",
+			videoID:  "https://www.bilibili.com/video/BV1xx411c7mD",
+			expected: "https://www.bilibili.com/video/BV1xx411c7mD",
+		},
+		{
+			name:     "unknown platform passes through",
+			platform: "other",
+			videoID:  "abc",
+			expected: "abc",
+		},
+	}
+
+	s := &VideoService{}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result := s.buildVideoURL(tt.platform, tt.videoID)
+			if result != tt.expected {
+				t.Errorf("buildVideoURL(%q, %q) = %v, want %v", tt.platform, tt.videoID, result, tt.expected)
+			}
+		})
+	}
+}
+
+func TestGetFormatSelector(t *testing.T) {
+	tests := []struct {
+		quality  string
+		expected string
+	}{
+		{quality: "", expected: bestFormatSelector},
+		{quality: "Auto", expected: bestFormatSelector},
+		{quality: "4K", expected: uhdFormatSelector},
+		{quality: "hd", expected: fhdFormatSelector},
+		{quality: "720p", expected: hdFormatSelector},
+		{quality: "worst", expected: worstFormatSelector},
+		{quality: "144p", expected: defaultFormatSelector},
+	}
+
+	s := &VideoService{}
+	for _, tt := range tests {
+		t.Run(tt.quality, func(t *testing.T) {
+			if result := s.getFormatSelector(tt.quality); result != tt.expected {
+				t.Errorf("getFormatSelector(%q) = %v, want %v", tt.quality, result, tt.expected)
+			}
+		})
+	}
+}
+
+func TestTruncateOutput(t *testing.T) {
+	short := truncateOutput([]byte("  ERROR: video unavailable\n"))
+	if short != "ERROR: video unavailable" {
+		t.Errorf("truncateOutput() = %q, want trimmed output", short)
+	}
+
+	long := truncateOutput([]byte(strings.Repeat("x", maxLoggedOutput*3)))
+	if want := strings.Repeat("x", maxLoggedOutput) + "... (truncated)"; long != want {
+		t.Errorf("truncateOutput() returned %d bytes, want %d", len(long), len(want))
+	}
+}
+
+func TestResolveShared_CallerCancelDoesNotFailOthers(t *testing.T) {
+	s := &VideoService{}
+	const want = "https://example.com/video.mp4"
+
+	var calls int32
+	started := make(chan struct{})
+	release := make(chan struct{})
+	fetch := func(ctx context.Context) (string, error) {
+		if atomic.AddInt32(&calls, 1) == 1 {
+			close(started)
+		}
+		select {
+		case <-release:
+			return want, nil
+		case <-ctx.Done():
+			return "", ctx.Err()
+		}
+	}
+
+	firstCtx, cancelFirst := context.WithCancel(context.Background())
+	firstErr := make(chan error, 1)
+	go func() {
+		_, err := s.resolveShared(firstCtx, "stream:youtube:abc123:720p", fetch)
+		firstErr <- err
+	}()
+	<-started
+
+	type result struct {
+		url string
+		err error
+	}
+	second := make(chan result, 1)
+	go func() {
+		url, err := s.resolveShared(context.Background(), "stream:youtube:abc123:720p", fetch)
+		second <- result{url, err}
+	}()
+	time.Sleep(50 * time.Millisecond) // let the second caller join the in-flight fetch
+
+	// The first caller gives up on its own while the shared fetch keeps running
+	cancelFirst()
+	select {
+	case err := <-firstErr:
+		if !errors.Is(err, context.Canceled) {
+			t.Fatalf("first caller error = %v, want context.Canceled", err)
+		}
+	case <-time.After(time.Second):
+		t.Fatal("cancelled caller is still waiting on the shared fetch")
+	}
+
+	close(release)
+	select {
+	case r := <-second:
+		if r.err != nil || r.url != want {
+			t.Fatalf("second caller = %q, %v, want %q, nil", r.url, r.err, want)
+		}
+	case <-time.After(time.Second):
+		t.Fatal("second caller did not receive the shared result")
+	}
+
+	if got := atomic.LoadInt32(&calls); got != 1 {
+		t.Errorf("fetch ran %d times, want 1", got)
+	}
+}
+
+func TestResolveShared_AllCallersCancelStopsFetch(t *testing.T) {
+	s := &VideoService{}
+
+	var calls int32
+	started := make(chan struct{})
+	stopped := make(chan error, 1)
+	fetch := func(ctx context.Context) (string, error) {
+		if atomic.AddInt32(&calls, 1) == 1 {
+			close(started)
+		}
+		<-ctx.Done()
+		stopped <- ctx.Err()
+		return "", ctx.Err()
+	}
+
+	firstCtx, cancelFirst := context.WithCancel(context.Background())
+	secondCtx, cancelSecond := context.WithCancel(context.Background())
+	errs := make(chan error, 2)
+	go func() {
+		_, err := s.resolveShared(firstCtx, "stream:youtube:abc123:720p", fetch)
+		errs <- err
+	}()
+	<-started
+	go func() {
+		_, err := s.resolveShared(secondCtx, "stream:youtube:abc123:720p", fetch)
+		errs <- err
+	}()
+	time.Sleep(50 * time.Millisecond) // let the second caller join the in-flight fetch
+
+	// One caller leaving must not stop the fetch the other is waiting on
+	cancelFirst()
+	if err := <-errs; !errors.Is(err, context.Canceled) {
+		t.Fatalf("first caller error = %v, want context.Canceled", err)
+	}
+	select {
+	case <-stopped:
+		t.Fatal("fetch was cancelled while a caller was still waiting")
+	case <-time.After(50 * time.Millisecond):
+	}
+
+	// Once the last caller leaves, the detached fetch is cancelled
+	cancelSecond()
+	if err := <-errs; !errors.Is(err, context.Canceled) {
+		t.Fatalf("second caller error = %v, want context.Canceled", err)
+	}
+	select {
+	case err := <-stopped:
+		if !errors.Is(err, context.Canceled) {
+			t.Errorf("fetch context error = %v, want context.Canceled", err)
+		}
+	case <-time.After(time.Second):
+		t.Fatal("fetch context was not cancelled after every caller left")
+	}
+
+	if got := atomic.LoadInt32(&calls); got != 1 {
+		t.Errorf("fetch ran %d times, want 1", got)
+	}
+}